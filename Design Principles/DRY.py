@@ -26,3 +26,118 @@ def save_user(name):
 def save_post(title):
     with open("p.txt","a") as f:
         f.write(sanitize(title) + "\n")
+
+
+# ✅ DRY at scale: one shared writer owns the file handles
+# save_user / save_post above pay an open + write + close per record.
+# AppendWriter keeps one handle per path open, collects sanitize()d records
+# in memory and writes them out in batches.
+import atexit
+import os
+import threading
+import time
+
+# Durability policies: how hard we push records to disk
+FSYNC_NEVER = "never"    # leave it to the OS page cache
+FSYNC_BATCH = "batch"    # fsync once per flushed batch
+FSYNC_RECORD = "record"  # flush + fsync after every record (slowest, safest)
+
+
+class AppendWriter:
+    """Shared append-only writer with size/time based batching."""
+
+    def __init__(self, max_bytes=64 * 1024, max_delay=1.0, durability=FSYNC_NEVER):
+        if durability not in (FSYNC_NEVER, FSYNC_BATCH, FSYNC_RECORD):
+            raise ValueError(f"Unknown durability policy: {durability!r}")
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.durability = durability
+        self._files = {}      # path -> open handle
+        self._pending = {}    # path -> list of lines not yet written
+        self._pending_bytes = 0
+        self._oldest = None   # monotonic time of the oldest pending record
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+        self._timer = None
+        self._registered = False  # atexit hook added on first append
+
+    def append(self, path, record):
+        line = sanitize(record) + "\n"
+        with self._lock:
+            if self._closed:
+                raise ValueError("I/O operation on closed AppendWriter")
+            if not self._registered:
+                atexit.register(self.close)
+                self._registered = True
+            self._pending.setdefault(path, []).append(line)
+            self._pending_bytes += len(line)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if (self.durability == FSYNC_RECORD
+                    or self._pending_bytes >= self.max_bytes
+                    or (self.max_delay is not None
+                        and time.monotonic() - self._oldest >= self.max_delay)):
+                self._flush_locked()
+            elif self._timer is None and self.max_delay is not None:
+                self._start_timer()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
+        self._stop.set()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ——— internals (call with self._lock held) ———
+
+    def _flush_locked(self):
+        for path, lines in self._pending.items():
+            if not lines:
+                continue
+            f = self._files.get(path)
+            if f is None:
+                f = self._files[path] = open(path, "a")
+            f.write("".join(lines))
+            f.flush()
+            if self.durability != FSYNC_NEVER:
+                os.fsync(f.fileno())
+        self._pending.clear()
+        self._pending_bytes = 0
+        self._oldest = None
+
+    def _start_timer(self):
+        # One daemon thread per writer so a quiet writer still honours max_delay
+        def run():
+            while not self._stop.wait(self.max_delay / 2):
+                with self._lock:
+                    if (self._oldest is not None
+                            and time.monotonic() - self._oldest >= self.max_delay):
+                        self._flush_locked()
+        self._timer = threading.Thread(target=run, name="AppendWriter", daemon=True)
+        self._timer.start()
+
+
+# The shared instance: every save_* goes through the same handles
+writer = AppendWriter()
+
+def save_user_buffered(name):
+    writer.append("u.txt", name)
+
+def save_post_buffered(title):
+    writer.append("p.txt", title)
@@ -13,3 +13,131 @@ def squares_bad(nums):
 # ✅ KISS: use list comprehension
 def squares(nums):
     return [n * n for n in nums]
+
+
+# ✅ Still simple, just typed: keep numbers unboxed when they come in unboxed
+# squares() above always builds a list of Python ints. Typed inputs keep
+# their type instead: array.array -> array.array, memoryview -> memoryview,
+# NumPy array -> NumPy array (NumPy is never imported here, we only look at
+# the type). Integer typecodes of up to 32 bits widen to 64 bits since
+# n * n needs twice the bits of n. 64-bit integers have nothing wider to go
+# to: they stay 64-bit as long as every square fits (|n| <= 3037000499
+# signed, n <= 4294967295 unsigned), and only a batch that would overflow
+# takes the exact squares() path (a list of Python ints).
+#
+# Without NumPy Python still has to box each element while multiplying, so
+# arrays are squared a chunk at a time: only CHUNK boxed numbers are alive at
+# once and the result stays a flat typed buffer.
+from array import array
+
+CHUNK = 1 << 14
+
+_WIDEN = {code: "q" if code.islower() else "Q" for code in "bhilqBHILQ"}
+_WIDEN.update(f="f", d="d")
+_FITS = {"q": 3037000499, "Q": 4294967295}  # largest |n| whose n * n fits
+
+def _fits(lo, hi, code):
+    return max(hi, -lo) <= _FITS[code]
+
+def squares_typed(nums):
+    if type(nums).__module__ == "numpy":
+        kind, size = nums.dtype.kind, nums.dtype.itemsize
+        if kind in "iu":
+            code = "q" if kind == "i" else "Q"
+            if size < 8:
+                nums = nums.astype("int64" if kind == "i" else "uint64")
+            elif nums.size and not _fits(int(nums.min()), int(nums.max()), code):
+                return squares(nums.tolist())
+        return nums * nums
+    if isinstance(nums, array) and nums.typecode in _WIDEN:
+        code = _WIDEN[nums.typecode]
+        if code in _FITS and nums.itemsize == 8 and nums and not _fits(min(nums), max(nums), code):
+            return squares(nums)
+        out = array(code)
+        for i in range(0, len(nums), CHUNK):
+            out.fromlist([n * n for n in nums[i:i + CHUNK]])
+        return out
+    if isinstance(nums, memoryview) and nums.format in _WIDEN:
+        typed = array(nums.format)
+        typed.frombytes(nums.cast("B") if nums.c_contiguous else nums.tobytes())
+        return memoryview(squares_typed(typed))
+    return squares(nums)
+
+
+# ✅ Inputs bigger than memory: stream them
+# A generator only ever holds one chunk, so the input can be any iterable
+# (a file, a socket, another generator) and never needs to fit in RAM.
+from itertools import islice
+
+def squares_stream(nums, chunk_size=CHUNK):
+    it = iter(nums)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield from squares(chunk)
+
+def squares_file(f, typecode, chunk_size=CHUNK):
+    """Yield typed chunks of squares from a binary file of packed `typecode` values."""
+    itemsize = array(typecode).itemsize
+    while True:
+        data = f.read(chunk_size * itemsize)
+        if not data:
+            return
+        chunk = array(typecode)
+        chunk.frombytes(data)
+        yield squares_typed(chunk)
+
+
+# ✅ Big typed inputs: split them across processes
+# Input and output live in shared memory, so workers only receive a few
+# names and indexes instead of pickled chunks. Each worker fills its own
+# slice of the output, which keeps results in input order.
+# (multiprocessing and concurrent.futures are imported on first use)
+import os
+
+PARALLEL_MIN = 1 << 20  # below this, process startup costs more than it saves
+
+def _square_slice(src_name, src_type, dst_name, dst_type, lo, hi):
+    # Workers only attach; the parent creates and unlinks both segments
+    from multiprocessing import shared_memory
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    nums, out = src.buf.cast(src_type), dst.buf.cast(dst_type)
+    try:
+        for i in range(lo, hi, CHUNK):
+            j = min(i + CHUNK, hi)
+            out[i:j] = array(dst_type, [n * n for n in nums[i:j]])
+    finally:
+        nums.release()
+        out.release()
+        src.close()
+        dst.close()
+
+def squares_parallel(nums, workers=None):
+    if not isinstance(nums, array) or nums.typecode not in _WIDEN or len(nums) < PARALLEL_MIN:
+        return squares_typed(nums)
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    workers = workers or os.cpu_count() or 1
+    out_type = _WIDEN[nums.typecode]
+    n = len(nums)
+    src = shared_memory.SharedMemory(create=True, size=n * nums.itemsize)
+    dst = shared_memory.SharedMemory(create=True, size=n * array(out_type).itemsize)
+    try:
+        src.buf[:n * nums.itemsize] = memoryview(nums).cast("B")
+        step = -(-n // workers)
+        with ProcessPoolExecutor(workers) as pool:
+            jobs = [pool.submit(_square_slice, src.name, nums.typecode, dst.name,
+                                out_type, lo, min(lo + step, n))
+                    for lo in range(0, n, step)]
+            for job in jobs:
+                job.result()
+        out = array(out_type)
+        out.frombytes(dst.buf[:n * out.itemsize])
+        return out
+    finally:
+        src.close()
+        src.unlink()
+        dst.close()
+        dst.unlink()
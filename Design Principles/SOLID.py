@@ -24,6 +24,28 @@ both should depend on abstractions
 '''
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from decimal import Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
+from operator import mul
+import atexit
+import mmap
+import os
+import queue
+import sys
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, writers are only serialised in-process
+    fcntl = None
+
+# asyncio, concurrent.futures and smtplib/email cost tens of milliseconds to
+# import, so the classes below that need them import them on first use.
 
 # 1. Single Responsibility Principle (SRP)
 #  every class should have a single responsibility or single job or single purpose
@@ -42,15 +64,469 @@ class UserManagerBad:
 class User:
     def __init__(self, name): self.name = name
 
+def _split_lines(data):
+    # Records may contain "\r" and other characters that splitlines() treats
+    # as line breaks; only b"\n" ends a record.
+    parts = data.split(b"\n")
+    tail = parts.pop()
+    lines = [part + b"\n" for part in parts]
+    if tail:
+        lines.append(tail)
+    return lines
+
 class UserRepository:
+    """Append-only user log with a persisted name -> offset index.
+
+    users.txt keeps the old one-name-per-line format. The index lives next
+    to it in users.txt.idx as "offset name" lines and only ever grows, so
+    startup indexes whatever was appended since the last run instead of
+    rescanning the whole log. Lookups read records through an mmap.
+
+    Every write holds an advisory flock on the log, so several processes
+    can share one users.txt without interleaving records (where fcntl is
+    available; elsewhere only the threads of one process are serialised).
+
+    With group_commit=True, save() first appends its records to a shared
+    spool, users.txt.spool, and then waits until they are committed.
+    Whichever writer finds the log's lock free writes everything spooled so
+    far, by any thread or process, in one write (and one fsync when
+    fsync=True); the other writers in that batch see it committed and
+    return. A batch fills up while the previous one is being written, so no
+    fixed delay is needed; `commit_window` optionally waits that much longer
+    for company. If the write fails, only the writer that tried it gets the
+    error; the records stay spooled for the next one.
+    """
+    # spool header: generation being filled, last generation committed
+    _SPOOL_HEADER = 42
+
+    def __init__(self, path="users.txt", group_commit=False,
+                 commit_window=0.0, fsync=False):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.group_commit = group_commit
+        self.commit_window = commit_window
+        self.fsync = fsync
+        self._offsets = {}       # name -> offset of its latest record
+        self._indexed_end = 0    # in-memory index covers the log up to here
+        self._persisted_end = 0  # users.txt.idx covers the log up to here
+        self._idx_pos = 0        # bytes of users.txt.idx already loaded
+        self._map = None
+        self._mutex = threading.RLock()  # guards the index state above
+        self._log = open(path, "a+b")
+        self._idx = open(self.index_path, "a+b")
+        self.spool_path = path + ".spool"
+        self._spool = None
+        self._spool_mutex = threading.Lock()
+        if group_commit:
+            open(self.spool_path, "ab").close()
+            self._spool = open(self.spool_path, "r+b", buffering=0)
+        with self._locked():
+            self._validate_index()
+            self._sync_index()
+            self._persist_gap()
+            if self._spool:
+                self._commit_spool()  # records left by a writer that died
+
     def save(self, user: User):
-        with open("users.txt", "a") as f:
-            f.write(user.name + "\n")
+        self.save_many([user])
+
+    def save_many(self, users):
+        records = [self._encode(user) for user in users]
+        if not records:
+            return
+        if not self.group_commit:
+            with self._locked():
+                self._append(records)
+            return
+        generation = self._spool_records(records)
+        if self.commit_window:
+            time.sleep(self.commit_window)
+        self._wait_for_commit(generation)
+
+    def get(self, name):
+        offset = self._lookup(name)
+        if offset is None:
+            return None
+        m = self._mapping()
+        return User(m[offset:m.find(b"\n", offset)].decode())
+
+    def exists(self, name):
+        return self._lookup(name) is not None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._log.close()
+        self._idx.close()
+        if self._spool:
+            self._spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ——— internals ———
+
+    @staticmethod
+    def _encode(user):
+        if "\n" in user.name:
+            raise ValueError("User name must not contain newlines")
+        return user.name.encode() + b"\n"
+
+    @staticmethod
+    @contextmanager
+    def _flocked(mutex, f):
+        # Threads of this process, then other processes
+        with mutex:
+            if fcntl is None:
+                yield
+                return
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _locked(self):
+        return self._flocked(self._mutex, self._log)
+
+    def _try_locked(self):
+        # Non-blocking _locked(): True (and the lock held) or False
+        if not self._mutex.acquire(blocking=False):
+            return False
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self._log.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            self._mutex.release()
+            return False
+
+    def _unlock(self):
+        if fcntl is not None:
+            fcntl.flock(self._log.fileno(), fcntl.LOCK_UN)
+        self._mutex.release()
+
+    def _wait_for_commit(self, generation):
+        # Whoever holds the log lock is writing a batch, quite likely with
+        # our records in it. Blocking on the lock would wait out that write
+        # and then the write of whoever grabs the lock next, so poll the
+        # spool until our generation is committed or the lock is free for us
+        # to commit it ourselves.
+        pause = 0.0001
+        while True:
+            with self._flocked(self._spool_mutex, self._spool):
+                if self._spool_state()[1] >= generation:
+                    return
+            if self._try_locked():
+                try:
+                    self._commit_spool(generation)
+                finally:
+                    self._unlock()
+                return
+            time.sleep(pause)
+            pause = min(2 * pause, 0.001)
+
+    def _spool_state(self):
+        # Caller holds the spool lock: (generation, committed, size)
+        f = self._spool
+        size = os.fstat(f.fileno()).st_size
+        if size < self._SPOOL_HEADER:  # new spool (or a torn header)
+            self._set_spool_header(1, 0)
+            f.truncate()
+            return 1, 0, self._SPOOL_HEADER
+        f.seek(0)
+        generation, committed = map(int, f.read(self._SPOOL_HEADER).split())
+        return generation, committed, size
+
+    def _set_spool_header(self, generation, committed):
+        self._spool.seek(0)
+        self._spool.write(b"%20d %20d\n" % (generation, committed))
+
+    def _spool_records(self, records):
+        """Queue records for the next group commit; returns their generation."""
+        f = self._spool
+        with self._flocked(self._spool_mutex, f):
+            generation, _, end = self._spool_state()
+            f.seek(end - 1)
+            if end > self._SPOOL_HEADER and f.read(1) != b"\n":
+                # a writer died mid-append: drop its torn record
+                f.seek(self._SPOOL_HEADER)
+                end = self._SPOOL_HEADER + f.read().rfind(b"\n") + 1
+                f.truncate(end)
+            f.seek(end)
+            f.write(b"".join(records))
+        return generation
+
+    def _commit_spool(self, generation=None):
+        # Caller holds the log's flock. The first writer here takes every
+        # spooled record, commits them in one go and marks that generation
+        # committed; writers whose records went with it find it committed
+        # and return. The spool lock is not held while writing, so the next
+        # batch keeps filling up meanwhile.
+        f = self._spool
+        with self._flocked(self._spool_mutex, f):
+            current, committed, _ = self._spool_state()
+            if generation is not None and committed >= generation:
+                return
+            data = f.read()
+            end = self._SPOOL_HEADER + data.rfind(b"\n") + 1
+            self._set_spool_header(current + 1, committed)
+        records = _split_lines(data[:end - self._SPOOL_HEADER])
+        if records:
+            # if this fails the records stay spooled and the next writer
+            # retries them; a crash after it commits them twice (the newest
+            # record per name wins, so only the log grows)
+            self._append(records)
+        with self._flocked(self._spool_mutex, f):
+            f.seek(end)
+            newer = f.read()  # spooled while we were writing
+            f.seek(self._SPOOL_HEADER)
+            f.write(newer)
+            f.truncate()
+            self._set_spool_header(current + 1, current)
+
+    def _append(self, records):
+        # Caller holds the flock
+        self._sync_index()
+        self._persist_gap()
+        offset = os.fstat(self._log.fileno()).st_size
+        self._log.write(b"".join(records))
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self._persist(offset, records)
+
+    def _lookup(self, name):
+        offset = self._offsets.get(name)
+        if offset is None:
+            self._catch_up()
+            offset = self._offsets.get(name)
+        return offset
+
+    def _mapping(self):
+        # Remap only when the log has grown past the current mapping. The old
+        # map is left to the GC so readers still holding it stay valid.
+        size = os.fstat(self._log.fileno()).st_size
+        if self._map is None or len(self._map) < size:
+            self._map = mmap.mmap(self._log.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _validate_index(self):
+        # Caller holds the flock. The last indexed record must still be in
+        # the log; otherwise the log was replaced and the index is rebuilt.
+        self._idx.seek(0, os.SEEK_END)
+        idx_size = self._idx.tell()
+        if not idx_size:
+            return
+        self._idx.seek(max(0, idx_size - 4096))
+        lines = _split_lines(self._idx.read())
+        if not lines[-1].endswith(b"\n"):  # drop a torn entry from a crash
+            idx_size -= len(lines.pop())
+            self._idx.truncate(idx_size)
+            if not lines:
+                return
+        last = lines[-1]
+        offset, _, name = last[:-1].partition(b" ")
+        record = name + b"\n"
+        size = os.fstat(self._log.fileno()).st_size
+        if (not offset.isdigit() or int(offset) + len(record) > size
+                or self._mapping()[int(offset):int(offset) + len(record)] != record):
+            self._idx.truncate(0)
+
+    def _sync_index(self):
+        """Load index entries other writers appended to users.txt.idx."""
+        self._idx.seek(0, os.SEEK_END)
+        if self._idx.tell() < self._idx_pos:  # index was rebuilt under us
+            self._offsets.clear()
+            self._idx_pos = self._persisted_end = self._indexed_end = 0
+        self._idx.seek(self._idx_pos)
+        for line in self._idx:
+            if not line.endswith(b"\n"):
+                break  # torn write; re-indexed from the log
+            offset, _, name = line[:-1].partition(b" ")
+            offset = int(offset)
+            self._offsets[name.decode()] = offset
+            self._persisted_end = offset + len(name) + 1
+            self._idx_pos += len(line)
+        self._indexed_end = max(self._indexed_end, self._persisted_end)
+
+    def _scan(self, start):
+        """(offset, records) for complete records in the log after start."""
+        size = os.fstat(self._log.fileno()).st_size
+        if size <= start:
+            return start, []
+        m = self._mapping()
+        stop = m.rfind(b"\n", start, size) + 1
+        if stop <= start:
+            return start, []  # only a partial record so far
+        return start, _split_lines(m[start:stop])
+
+    def _catch_up(self):
+        """Index (in memory only) records appended by anyone."""
+        with self._mutex:
+            self._sync_index()
+            offset, records = self._scan(self._indexed_end)
+            for record in records:
+                self._offsets[record[:-1].decode()] = offset
+                offset += len(record)
+            self._indexed_end = offset
+
+    def _persist_gap(self):
+        # Caller holds the flock: index records written without the index
+        # (older writers, crashes between the log and index writes)
+        offset, records = self._scan(self._persisted_end)
+        if records:
+            self._persist(offset, records)
+
+    def _persist(self, offset, records):
+        # Caller holds the flock
+        entries = []
+        for record in records:
+            self._offsets[record[:-1].decode()] = offset
+            entries.append(b"%d %s" % (offset, record))
+            offset += len(record)
+        self._persisted_end = offset
+        self._indexed_end = max(self._indexed_end, offset)
+        data = b"".join(entries)
+        self._idx.write(data)
+        self._idx.flush()
+        self._idx_pos += len(data)
+
+class SMTPPool:
+    """Thread-safe pool of reusable SMTP connections (at most `size` open)."""
+    def __init__(self, host="localhost", port=25, size=4, timeout=10, factory=None):
+        if factory is None:
+            import smtplib
+            factory = smtplib.SMTP
+        self.host, self.port, self.timeout = host, port, timeout
+        self.size = size
+        self._factory = factory
+        self._idle = queue.LifoQueue()  # most recently used first: least likely timed out
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._factory(self.host, self.port, timeout=self.timeout)
+            try:
+                yield conn
+            except BaseException as exc:
+                if self._reusable(conn, exc):
+                    self._idle.put(conn)
+                else:
+                    self._discard(conn)
+                raise
+            self._idle.put(conn)
+
+    @staticmethod
+    def _reusable(conn, exc):
+        # The server answered (e.g. a transient 451) and smtplib has already
+        # reset the transaction: the connection is still good. After anything
+        # else (socket errors, disconnects, 421) its state is unknown.
+        import smtplib
+        replied = isinstance(exc, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused))
+        return replied and getattr(conn, "sock", None) is not None
+
+    @staticmethod
+    def _discard(conn):
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    def close(self):
+        import smtplib
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.quit()
+            except (OSError, smtplib.SMTPException):
+                self._discard(conn)
+
+
+def _transient(exc):
+    """Worth retrying: a 4xx reply or a network error, not a 5xx rejection."""
+    import smtplib
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    if isinstance(exc, smtplib.SMTPException):
+        return isinstance(exc, smtplib.SMTPServerDisconnected)
+    return isinstance(exc, OSError)
+
 
 class EmailService:
+    """Sends welcome mails over pooled SMTP connections.
+
+    send_welcome_many() sends a whole batch from asyncio: at most
+    `max_in_flight` messages are queued at once, the blocking smtplib calls
+    run on one thread per pooled connection, and transient failures (4xx
+    replies, network errors) are retried with exponential backoff.
+    """
+    def __init__(self, host="localhost", port=25, sender="welcome@example.com",
+                 domain="example.com", pool_size=4, max_in_flight=64,
+                 retries=3, backoff=0.1):
+        self.sender, self.domain = sender, domain
+        self.max_in_flight = max_in_flight
+        self.retries, self.backoff = retries, backoff
+        self.pool = SMTPPool(host, port, size=pool_size)
+        self._threads = None
+
+    def address_of(self, user: User):
+        return getattr(user, "email", None) or f"{user.name}@{self.domain}"
+
+    def _message(self, user):
+        from email.message import EmailMessage
+        msg = EmailMessage()
+        msg["From"] = self.sender
+        msg["To"] = self.address_of(user)
+        msg["Subject"] = "Welcome!"
+        msg.set_content(f"Hi {user.name}, welcome aboard.")
+        return msg
+
     def send_welcome(self, user: User):
-        # … email logic …
-        pass
+        with self.pool.connection() as conn:
+            conn.send_message(self._message(user))
+
+    async def send_welcome_many(self, users):
+        """Send to every user; returns None or the final exception per user, in order."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self.pool.size, thread_name_prefix="smtp")
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        async def send(user):
+            async with in_flight:
+                for attempt in range(self.retries + 1):
+                    try:
+                        await loop.run_in_executor(self._threads, self.send_welcome, user)
+                        return None
+                    except OSError as exc:  # smtplib.SMTPException included
+                        if attempt == self.retries or not _transient(exc):
+                            return exc
+                        await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        return await asyncio.gather(*map(send, users))
+
+    def close(self):
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+        self.pool.close()
 
 
 # 2. Open/Closed Principle (OCP)
@@ -61,12 +537,82 @@ class Discount:
     def apply(self, amount): return amount
 
 # New behavior added via subclass—no edit to Discount
-class SeasonalDiscount(Discount):
-    def apply(self, amount): return amount * 0.9
+class RateDiscount(Discount):
+    rate = 1.0
+    def apply(self, amount): return amount * self.rate
+
+class SeasonalDiscount(RateDiscount):
+    rate = 0.9
 
 def checkout(amount, discount: Discount):
     return discount.apply(amount)
 
+# Pricing a whole order book: DiscountPipeline takes a chain of discounts and
+# generates one function that applies all of them to every amount in a
+# single pass. Plain Discount steps are dropped, RateDiscount steps become
+# inline multiplications (left to right, so the floats match checkout()
+# step by step bit for bit) and any other subclass is called through its
+# own apply(). Generated code is cached per chain shape; rates are read on
+# every call, so a discount whose rate changes later is priced like checkout().
+_pipeline_code = {}  # chain shape -> compiled function
+
+class DiscountPipeline:
+    def __init__(self, discounts):
+        self.discounts = tuple(discounts)
+        shape, self._steps = [], []
+        for d in self.discounts:
+            apply = type(d).apply
+            if apply is Discount.apply:
+                continue
+            shape.append("*" if apply is RateDiscount.apply else "()")
+            self._steps.append(d)
+        self._float = self._compile(tuple(shape), "array('d', [{}])")
+        self._decimal = self._compile(tuple(shape), "[{}]")
+        self._shape = shape
+
+    @staticmethod
+    def _compile(shape, result):
+        key = (shape, result)
+        fn = _pipeline_code.get(key)
+        if fn is None:
+            expr = "a"
+            for i, step in enumerate(shape):
+                expr = f"{expr} * k{i}" if step == "*" else f"k{i}({expr})"
+            params = "".join(f", k{i}" for i in range(len(shape)))
+            src = (f"def run(amounts{params}):\n"
+                   f"    return {result.format(f'{expr} for a in amounts')}\n")
+            namespace = {"array": array}
+            exec(src, namespace)
+            fn = _pipeline_code[key] = namespace["run"]
+        return fn
+
+    def _args(self):
+        return [d.rate if step == "*" else d.apply
+                for step, d in zip(self._shape, self._steps)]
+
+    def apply(self, amounts):
+        """Float amounts in, array('d') out; same values as chained checkout()."""
+        return self._float(amounts, *self._args())
+
+    def apply_decimal(self, amounts, places=None):
+        """Decimal amounts in, Decimals out; optionally rounded to `places`
+        decimal places (places=2 rounds to cents, half to even)."""
+        # exact money math: rates as the Decimal they were written as
+        args = [Decimal(repr(a)) if isinstance(a, float) else a for a in self._args()]
+        out = self._decimal(amounts, *args)
+        if places is not None:
+            exp = Decimal(1).scaleb(-places)
+            out = [a.quantize(exp, ROUND_HALF_EVEN) for a in out]
+        return out
+
+@lru_cache(maxsize=256)
+def pipeline(*discounts):
+    """Cached DiscountPipeline for this exact chain of discount objects."""
+    return DiscountPipeline(discounts)
+
+def checkout_many(amounts, *discounts):
+    return pipeline(*discounts).apply(amounts)
+
 
 # 3. Liskov Substitution Principle (LSP)
 # This principle ensures that any class that is the child of a parent class should be usable in place of its parent without any unexpected behaviour. 
@@ -84,8 +630,95 @@ class Square(Rectangle):
 def print_area(rect: Rectangle):
     print(rect.area())
 
-print_area(Rectangle(2, 3))  # 6
-print_area(Square(4))        # 16
+if __name__ == "__main__":
+    print_area(Rectangle(2, 3))  # 6
+    print_area(Square(4))        # 16
+
+# Because every Square is a valid Rectangle, a collection can lean on that:
+# ShapeCollection groups shapes by concrete type and keeps their dimensions
+# in columns (widths, heights; sides for squares), so areas are one map()
+# over the columns per type instead of one area() call per object. A
+# subclass that overrides area() simply keeps its objects and is asked
+# one at a time, and so does any shape whose dimensions aren't all floats:
+# an array("d") column would turn int areas into floats and round big ints,
+# Decimals and Fractions, so areas() would no longer match area().
+class ShapeCollection:
+    # type -> (dimension attributes, kernel over those columns)
+    kernels = {
+        Rectangle: (("_w", "_h"), lambda w, h: map(mul, w, h)),
+        Square: (("_w",), lambda s: map(mul, s, s)),
+    }
+
+    def __init__(self, shapes=()):
+        self._groups = {}  # (concrete type, columnar) -> [positions, columns or objects, kernel]
+        self._kernel_of = {}  # concrete type -> kernel or None
+        self._len = 0
+        for shape in shapes:
+            self.add(shape)
+
+    def _kernel_for(self, cls):
+        # nearest registered ancestor whose area() this class still uses
+        for base in cls.__mro__:
+            if base in self.kernels:
+                return self.kernels[base] if cls.area is base.area else None
+        return None
+
+    def add(self, shape):
+        cls = type(shape)
+        kernel = self._kernel_of.get(cls, False)
+        if kernel is False:
+            kernel = self._kernel_of[cls] = self._kernel_for(cls)
+        if kernel and not all(type(getattr(shape, a)) is float for a in kernel[0]):
+            kernel = None  # exact dimensions: keep the object
+        group = self._groups.get((cls, kernel is not None))
+        if group is None:
+            columns = [array("d") for _ in kernel[0]] if kernel else []
+            group = self._groups[cls, kernel is not None] = [array("l"), columns, kernel]
+        positions, columns, kernel = group
+        positions.append(self._len)
+        if kernel:
+            for column, attr in zip(columns, kernel[0]):
+                column.append(getattr(shape, attr))
+        else:
+            columns.append(shape)
+        self._len += 1
+
+    def __len__(self):
+        return self._len
+
+    def _group_areas(self, kind=None):
+        for (cls, _), (positions, columns, kernel) in self._groups.items():
+            if kind is not None and not issubclass(cls, kind):
+                continue
+            if kernel:
+                yield positions, kernel[1](*columns)
+            else:
+                yield positions, (shape.area() for shape in columns)
+
+    def areas(self):
+        """area() of every shape, in insertion order."""
+        out = [0.0] * self._len
+        for positions, areas in self._group_areas():
+            for i, a in zip(positions, areas):
+                out[i] = a
+        return out
+
+    def total_area(self, kind=None, min_area=None):
+        """Sum of areas, optionally only shapes of `kind` / at least `min_area`."""
+        total = 0
+        for _, areas in self._group_areas(kind):
+            total += sum(areas if min_area is None else (a for a in areas if a >= min_area))
+        return total
+
+    def count(self, kind=None, min_area=None):
+        n = 0
+        for positions, areas in self._group_areas(kind):
+            n += len(positions) if min_area is None else sum(1 for a in areas if a >= min_area)
+        return n
+
+if __name__ == "__main__":
+    shapes = ShapeCollection([Rectangle(2, 3), Square(4), Rectangle(0.5, 4.0)])
+    print(shapes.areas(), shapes.total_area(kind=Square))  # [6, 16, 2.0] 16
 
 
 # 4. Interface Segregation Principle (ISP)
@@ -101,14 +734,170 @@ class Writer(ABC):
     def write(self, data): ...
 
 class FileHandler(Reader, Writer):
-    def __init__(self, path): self.path = path
-    def read(self): ...
-    def write(self, data): ...
+    """Large-file reader/writer that avoids copying.
+
+    read() memory-maps the file, chunks() walks that mapping as memoryview
+    slices, readinto() fills a buffer you already own, and write()/writev()
+    take any bytes-like objects and append them without joining.
+    """
+    IOV_MAX = 1024  # buffers per writev() syscall on Linux
+
+    def __init__(self, path):
+        self.path = path
+        self._map = None
+
+    def read(self):
+        """The whole file as a read-only mmap (bytes-like, sliceable, no copy)."""
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return b""
+            if self._map is None or len(self._map) != size:
+                # remapped after writes; an old map lives on while views use it
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def chunks(self, size=1 << 20):
+        """Yield memoryview slices of the mapped file, `size` bytes each.
+
+        Each slice is released when the iterator moves on; copy it
+        (bytes(chunk)) to keep it longer.
+        """
+        data = self.read()
+        with memoryview(data) as view:
+            for start in range(0, len(view), size):
+                with view[start:start + size] as chunk:
+                    yield chunk
+
+    def readinto(self, buf, offset=0):
+        """Read into a caller-provided writable buffer; returns bytes read."""
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            return os.preadv(fd, [buf], offset)
+        finally:
+            os.close(fd)
+
+    def write(self, data):
+        return self.writev([data])
+
+    def writev(self, buffers):
+        """Append many buffers with as few writev() calls as possible."""
+        buffers = list(buffers)
+        sizes = [len(b) if type(b) in (bytes, bytearray) else memoryview(b).nbytes
+                 for b in buffers]
+        total = i = 0
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            while i < len(buffers):
+                n = os.writev(fd, buffers[i:i + self.IOV_MAX])
+                total += n
+                # skip what was written, keeping the tail of a partial buffer
+                while i < len(buffers) and n >= sizes[i]:
+                    n -= sizes[i]
+                    i += 1
+                if n:
+                    buffers[i] = memoryview(buffers[i]).cast("B")[n:]
+                    sizes[i] -= n
+        finally:
+            os.close(fd)
+        return total
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()  # BufferError if chunk views are still held
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 '''
 A ReadOnlyCache that only needs to fetch data, you can just subclass Reader—and you’re not dragged into providing a no‑op write() method you’ll never use.
 '''
 
+# The same split works for asyncio code: small async interfaces, and an
+# AsyncFileHandler that implements both. Blocking file calls run on a
+# bounded thread pool so the event loop never waits on the disk, and a
+# per-path semaphore caps how many operations hit the same file at once.
+# A cancelled call still lets its thread finish (threads can't be
+# interrupted) before the cancellation propagates, so the per-path limit
+# holds and files are always closed.
+class AsyncReader(ABC):
+    @abstractmethod
+    async def read(self): ...
+
+class AsyncWriter(ABC):
+    @abstractmethod
+    async def write(self, data): ...
+
+_io_pool = None                             # shared default thread pool
+_path_limits = weakref.WeakKeyDictionary()  # event loop -> {path: Semaphore}
+
+def _default_io_pool():
+    global _io_pool
+    if _io_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="file-io")
+    return _io_pool
+
+class AsyncFileHandler(AsyncReader, AsyncWriter):
+    def __init__(self, path, executor=None, per_path=4, chunk_size=1 << 20):
+        self.path = path
+        self.per_path = per_path
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self._sync = FileHandler(path)
+
+    def _limit(self):
+        import asyncio
+        limits = _path_limits.setdefault(asyncio.get_running_loop(), {})
+        key = os.path.abspath(self.path)
+        sem = limits.get(key)
+        if sem is None:
+            sem = limits[key] = asyncio.Semaphore(self.per_path)
+        return sem
+
+    async def _run(self, fn, *args):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        async with self._limit():
+            fut = loop.run_in_executor(self._executor or _default_io_pool(), fn, *args)
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                await asyncio.wait([fut])  # let the thread finish first
+                raise
+
+    async def read(self):
+        return await self._run(self._read_all)
+
+    async def write(self, data):
+        return await self._run(self._sync.write, data)
+
+    async def writev(self, buffers):
+        return await self._run(self._sync.writev, list(buffers))
+
+    async def chunks(self, size=None):
+        """async for chunk in handler.chunks(): ... (bytes, `size` at a time)"""
+        f = await self._run(open, self.path, "rb")
+        try:
+            while True:
+                chunk = await self._run(f.read, size or self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            f.close()  # cheap, and must run even if the task was cancelled
+
+    def __aiter__(self):
+        return self.chunks()
+
+    def _read_all(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
 # 5. Dependency Inversion Principle (DIP)
 # High-level modules should not depend on low-level modules. Both should depend on abstractions
 # ————————————————————————————————————————————————
@@ -127,8 +916,153 @@ class App:
         self._logger.log("App started")
 
 # wiring
-app = App(ConsoleLogger())
-app.run()
+if __name__ == "__main__":
+    app = App(ConsoleLogger())
+    app.run()
+
+# Because App only knows about Logger, a very different implementation can
+# be swapped in without touching App: AsyncLogger never blocks the caller on
+# terminal/pipe/file I/O. log() just drops the message into a bounded ring
+# buffer; a background thread formats and writes whole batches.
+# When the buffer is full the overflow policy decides: wait for room
+# (block), throw away the oldest queued message (drop-oldest) or the new one
+# (drop-newest); `dropped` counts what was lost.
+# A batch the sink fails to write (full disk, closed pipe...) is lost too:
+# `errors` counts those messages and `last_error` keeps the exception, and
+# the thread carries on with the next batch.
+BLOCK, DROP_OLDEST, DROP_NEWEST = "block", "drop-oldest", "drop-newest"
+
+class AsyncLogger(Logger):
+    def __init__(self, capacity=8192, overflow=BLOCK, stream=None, path=None,
+                 max_bytes=None, backups=3):
+        if overflow not in (BLOCK, DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.dropped = self.errors = 0
+        self.last_error = None
+        self.path, self.max_bytes, self.backups = path, max_bytes, backups
+        self._stream = stream
+        self._file = open(path, "a") if path else None
+        self._ring = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._queued = self._written = 0  # message counts, for flush()
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="AsyncLogger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, msg):
+        with self._lock:
+            if self._closed:
+                raise ValueError("log() on a closed AsyncLogger")
+            self._check_thread()
+            if len(self._ring) >= self.capacity:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                if self.overflow == DROP_OLDEST:
+                    self._ring.popleft()
+                    self.dropped += 1
+                    self._written += 1  # it will never be written; keep flush() honest
+                else:
+                    while len(self._ring) >= self.capacity and not self._closed:
+                        self._check_thread()
+                        self._not_full.wait(0.1)
+            self._ring.append(msg)
+            self._queued += 1
+            if len(self._ring) == 1:
+                self._not_empty.notify()
+
+    def flush(self):
+        """Wait until everything logged so far has been written."""
+        with self._lock:
+            target = self._queued
+            while self._written < target:
+                self._check_thread()
+                self._not_full.wait(0.1)
+
+    def _check_thread(self):
+        # only a BaseException escaping _drain can stop the thread early
+        if not self._thread.is_alive() and not self._closed:
+            raise RuntimeError("AsyncLogger writer thread has died")
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify()
+            self._not_full.notify_all()
+        self._thread.join()
+        if self._file:
+            self._file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ——— background thread ———
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                while not self._ring and not self._closed:
+                    self._not_empty.wait()
+                if not self._ring:
+                    return  # closed and drained
+                batch, self._ring = self._ring, deque()
+                self._not_full.notify_all()
+            try:
+                self._write([f"{msg}\n" for msg in batch])
+            except Exception as exc:
+                with self._lock:
+                    self.errors += len(batch)
+                    self.last_error = exc
+            finally:
+                with self._lock:
+                    self._written += len(batch)
+                    self._not_full.notify_all()
+
+    def _write(self, lines):
+        if self._file is None:
+            stream = self._stream or sys.stdout
+            stream.write("".join(lines))
+            stream.flush()
+            return
+        if not self.max_bytes:
+            self._file.write("".join(lines))
+            self._file.flush()
+            return
+        # A batch can be the whole ring: split it wherever the file reaches
+        # max_bytes, so files stay within it (a longer message gets its own).
+        size, start = self._file.tell(), 0
+        for i, line in enumerate(lines):
+            n = len(line) if line.isascii() else len(line.encode(self._file.encoding))
+            if size and size + n > self.max_bytes:
+                self._file.write("".join(lines[start:i]))
+                self._rotate()
+                size, start = 0, i
+            size += n
+        self._file.write("".join(lines[start:]))
+        self._file.flush()
+
+    def _rotate(self):
+        # app.log -> app.log.1 -> app.log.2 ... keeping `backups` old files
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a")
 
 
 '''
@@ -31,7 +31,8 @@ class Beagle(Dog):  # Partial Abstraction
         print("Beagle Bark!")
 
 # Example Usage
-dogs = [Labrador("Buddy"), Beagle("Charlie")]
-for dog in dogs:
-    dog.display_name()  # Calls concrete method
-    dog.sound()  # Calls implemented abstract method
\ No newline at end of file
+if __name__ == "__main__":
+    dogs = [Labrador("Buddy"), Beagle("Charlie")]
+    for dog in dogs:
+        dog.display_name()  # Calls concrete method
+        dog.sound()  # Calls implemented abstract method
\ No newline at end of file
@@ -39,9 +39,13 @@ class Snake(Animal):
 
 
 
-dog = Dog()
-print(dog.speak(), dog.move())
-# >> Woof! Runs on 4 legs
-
-snake = Snake()
-# TypeError: Can't instantiate abstract class Snake with abstract methods move
+if __name__ == "__main__":
+    dog = Dog()
+    print(dog.speak(), dog.move())
+    # >> Woof! Runs on 4 legs
+
+    try:
+        snake = Snake()
+    except TypeError as err:
+        print("TypeError:", err)
+    # TypeError: Can't instantiate abstract class Snake with abstract methods move
@@ -37,25 +37,26 @@ Objects
 A concrete instantiation of a class. Each object has its own state.
 '''
 
-alice = Person("Alice", 30) # Object // Instance of class person
-bob   = Person("Bob", 25)
+if __name__ == "__main__":
+    alice = Person("Alice", 30) # Object // Instance of class person
+    bob   = Person("Bob", 25)
 
-# accessing attributes:
-print(alice.name)  # "Alice" // Instance variable
-print(bob.age)     # 25
-print(bob.species) # Class variable
+    # accessing attributes:
+    print(alice.name)  # "Alice" // Instance variable
+    print(bob.age)     # 25
+    print(bob.species) # Class variable
 
-print(Person.species)  # Class variable can be accessed via class
+    print(Person.species)  # Class variable can be accessed via class
 
 
-print(alice.species, bob.species)  # both "Homo sapiens"
+    print(alice.species, bob.species)  # both "Homo sapiens"
 
-Person.species = "H. sapiens" # Overriding class variable
-print(alice.species, bob.species)  # both "H. sapiens"
+    Person.species = "H. sapiens" # Overriding class variable
+    print(alice.species, bob.species)  # both "H. sapiens"
 
-alice.species = "Cyborg" # Overriding for single instance
-print(alice.species)  # "Cyborg"
-print(bob.species)    # still "H. sapiens"
+    alice.species = "Cyborg" # Overriding for single instance
+    print(alice.species)  # "Cyborg"
+    print(bob.species)    # still "H. sapiens"
 
 
 ''' 
@@ -65,4 +66,5 @@ A function defined inside a class that operates on instances.
 
 '''
 
-print(alice.greet())  # "Hello, I’m Alice and I’m 30 years old."
+if __name__ == "__main__":
+    print(alice.greet())  # "Hello, I’m Alice and I’m 30 years old."
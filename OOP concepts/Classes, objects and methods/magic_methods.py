@@ -86,7 +86,9 @@ class Person:
         return self._name
 
     def set_name(self, new_name):
+        old_name = self.__dict__.get("_name")
         self._name = new_name
+        self._renamed(old_name)
     
     # Alternative to getters and setters, there is @property decorator
     # Can run validations when reading/writing
@@ -106,7 +108,22 @@ class Person:
         """Setter: p.name = value"""
         if not isinstance(new_name, str):
             raise TypeError("Name must be a string")
+        old_name = self.__dict__.get("_name")
         self._name = new_name
+        self._renamed(old_name)
+
+    # PersonIndex membership (section 10), kept off the instances so copy()
+    # and pickle never carry it: id(person) -> (weakref, [weakref to index])
+    _index_registry = {}
+
+    def _renamed(self, old_name):
+        # Keep any PersonIndex holding this person up to date
+        entry = Person._index_registry.get(id(self))
+        if entry is not None and entry[0]() is self:
+            for ref in list(entry[1]):
+                index = ref()
+                if index is not None:
+                    index._renamed(self, old_name)
     
     @name.deleter
     def name(self):
@@ -127,7 +144,38 @@ class Person:
         current_year = 2025
         age = current_year - birth_year
         return cls(name, age)
-    
+
+    @classmethod
+    def from_records(cls, records, columnar=False, trusted=False):
+        """Bulk constructor from (name, age) pairs.
+
+        The batch is validated once up front (skip with trusted=True), then
+        objects are built without going through the name setter. Returns a
+        list of Person, or a PersonTable when columnar=True.
+        """
+        records = list(records)
+        if not trusted:
+            _check_names(name for name, _ in records)
+        if columnar:
+            table = PersonTable()
+            table._extend_records(records)
+            return table
+        return _build_people(cls, records)
+
+    @classmethod
+    def from_csv(cls, path, workers=1, columnar=False, header=True,
+                 chunk_size=None):
+        """Bulk constructor from a `name,age` CSV file (see section 12)."""
+        table = PersonTable() if columnar else None
+        people = []
+        chunks = _parse_csv(path, workers, header, chunk_size or CSV_CHUNK)
+        for names, codes, ages in chunks:
+            if table is not None:
+                table._extend_encoded(names, codes, ages)
+            else:
+                people += _build_people(cls, zip(map(names.__getitem__, codes), ages))
+        return table if columnar else people
+
     @classmethod
     def get_class_age(cls):
         return cls.species
@@ -147,70 +195,582 @@ class Person:
 # —————————————————————————————————————————————————————
 # 1. Instantiation & Alternate Constructor
 # —————————————————————————————————————————————————————
-alice         = Person("Alice", 30)  
-bob           = Person("Bob",   25)
-alice_clone   = Person("Alice", 30)
-charlie       = Person.from_birth_year("Charlie", 1997)  
-#  from_birth_year is a @classmethod that computes age from birth year
+if __name__ == "__main__":
+    alice         = Person("Alice", 30)  
+    bob           = Person("Bob",   25)
+    alice_clone   = Person("Alice", 30)
+    charlie       = Person.from_birth_year("Charlie", 1997)  
+    #  from_birth_year is a @classmethod that computes age from birth year
+
+    # —————————————————————————————————————————————————————
+    # 2. Representation: __repr__ vs __str__
+    # —————————————————————————————————————————————————————
+    print(repr(alice))  
+    # >> Person(name='Alice', age=30, species = Homo sapiens)
+    # repr() is meant to be unambiguous, developer‐oriented
+
+    print(str(alice))   
+    # >> Alice (Homo sapiens, 30 years old)
+    # str()/print shows a user‑friendly summary
+
+    # —————————————————————————————————————————————————————
+    # 3. Comparison: __eq__ and __lt__ (used by sorted())
+    # —————————————————————————————————————————————————————
+    print(alice == bob)          # >> False  
+    print(alice == alice_clone)  # >> True  
+
+    people = [alice, bob, alice_clone]
+    print(sorted(people))        
+    # >> [Bob (Homo sapiens, 25 years old), 
+    #     Alice (Homo sapiens, 30 years old),
+    #     Alice (Homo sapiens, 30 years old)]
+    # sorted() uses __lt__ to compare ages
+
+    # —————————————————————————————————————————————————————
+    # 4. Container & Callable Protocols: __len__ & __call__
+    # —————————————————————————————————————————————————————
+    print(len(alice))   # >> 5  
+    # __len__ returns len(self.name)
+
+    print(alice())      # >> Hello, I’m Alice and I’m 30 years old.
+    # __call__ makes the instance “callable” and returns greet()
+
+    # —————————————————————————————————————————————————————
+    # 5. Context Management: __enter__ & __exit__
+    # —————————————————————————————————————————————————————
+    with Person("Bob", 25) as p:
+        print(p.greet())
+    # >> [Entering context for Bob]
+    # >> Hello, I’m Bob and I’m 25 years old.
+    # >> [Exiting context for Bob]
+
+    # —————————————————————————————————————————————————————
+    # 6. Plain Getters & Setters
+    # —————————————————————————————————————————————————————
+    alice.set_name("Alicia")  
+    print(alice.get_name())  # >> Alicia
+
+    print(Person.get_class_age())
+
+    # —————————————————————————————————————————————————————
+    # 7. @property Accessors (cleaner syntax)
+    # —————————————————————————————————————————————————————
+    alice.name = "Alice"     # calls @name.setter (with validation)
+    print(alice.name)        # calls @property name
+
+    # —————————————————————————————————————————————————————
+    # 8. Static Method
+    # —————————————————————————————————————————————————————
+    print(Person.is_valid_name("Eve"))    # >> True  
+    print(Person.is_valid_name("Eve123")) # >> False    
 
 # —————————————————————————————————————————————————————
-# 2. Representation: __repr__ vs __str__
+# 9. Columnar storage: PersonTable
 # —————————————————————————————————————————————————————
-print(repr(alice))  
-# >> Person(name='Alice', age=30, species = Homo sapiens)
-# repr() is meant to be unambiguous, developer‐oriented
+'''
 
-print(str(alice))   
-# >> Alice (Homo sapiens, 30 years old)
-# str()/print shows a user‑friendly summary
+Every Person carries its own instance __dict__. For millions of records a
+table stores the same data column-wise instead: names are dictionary-encoded
+(each distinct name stored once, rows keep a small integer code) and ages sit
+in one typed array. Rows come back as lightweight PersonRow views that
+behave like Person for greet / == / < / str / repr.
 
-# —————————————————————————————————————————————————————
-# 3. Comparison: __eq__ and __lt__ (used by sorted())
-# —————————————————————————————————————————————————————
-print(alice == bob)          # >> False  
-print(alice == alice_clone)  # >> True  
+'''
+import heapq
+import sys
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import repeat
+from operator import attrgetter, itemgetter
 
-people = [alice, bob, alice_clone]
-print(sorted(people))        
-# >> [Bob (Homo sapiens, 25 years old), 
-#     Alice (Homo sapiens, 30 years old),
-#     Alice (Homo sapiens, 30 years old)]
-# sorted() uses __lt__ to compare ages
 
-# —————————————————————————————————————————————————————
-# 4. Container & Callable Protocols: __len__ & __call__
-# —————————————————————————————————————————————————————
-print(len(alice))   # >> 5  
-# __len__ returns len(self.name)
+class PersonRow:
+    """View of one row of a PersonTable; reads the columns on demand."""
+    __slots__ = ("_table", "_i")
 
-print(alice())      # >> Hello, I’m Alice and I’m 30 years old.
-# __call__ makes the instance “callable” and returns greet()
+    def __init__(self, table, i):
+        self._table = table
+        self._i = i
+
+    @property
+    def name(self):
+        t = self._table
+        return t._names[t._codes[self._i]]
+
+    @property
+    def age(self):
+        return self._table._ages[self._i]
+
+    @property
+    def species(self):
+        return self._table.species
+
+    greet = Person.greet
+    __str__ = Person.__str__
+    __repr__ = Person.__repr__
+
+    def __eq__(self, other):
+        if not isinstance(other, (Person, PersonRow)):
+            return NotImplemented
+        return (self.name, self.age) == (other.name, other.age)
+
+    def __lt__(self, other):
+        if not isinstance(other, (Person, PersonRow)):
+            return NotImplemented
+        return self.age < other.age
+
+    # Person only has __lt__: `person < row` is answered by row.__gt__, so a
+    # mix of the two sorts like a list of Person
+    def __gt__(self, other):
+        if not isinstance(other, (Person, PersonRow)):
+            return NotImplemented
+        return self.age > other.age
+
+    def __le__(self, other):
+        if not isinstance(other, (Person, PersonRow)):
+            return NotImplemented
+        return self.age <= other.age
+
+    def __ge__(self, other):
+        if not isinstance(other, (Person, PersonRow)):
+            return NotImplemented
+        return self.age >= other.age
+
+
+def _bad_age(name, age):
+    # Person takes any age, but the age column is array("H")
+    kind = ValueError if isinstance(age, int) else TypeError
+    return kind(f"PersonTable can't store age {age!r} for {name!r}: "
+                "ages must be whole numbers from 0 to 65535")
+
+
+class PersonTable:
+    """Column-wise store of (name, age) records."""
+    species = Person.species
+
+    def __init__(self):
+        self._names = []         # code -> name
+        self._code_of = {}       # name -> code
+        self._codes = array("I")
+        self._ages = array("H")
+
+    @classmethod
+    def from_people(cls, people):
+        table = cls()
+        for p in people:
+            table.append(p.name, p.age)
+        return table
+
+    def append(self, name, age):
+        if not isinstance(name, str):
+            raise TypeError("Name must be a string")
+        try:
+            self._ages.append(age)  # first: a bad age must not leave a code behind
+        except (TypeError, OverflowError):
+            raise _bad_age(name, age) from None
+        code = self._code_of.get(name)
+        if code is None:
+            code = self._code_of[name] = len(self._names)
+            self._names.append(name)
+        self._codes.append(code)
+
+    def _extend_records(self, records):
+        # Names already validated by the caller
+        code_of, names = self._code_of, self._names
+        codes, ages = self._codes, self._ages
+        for name, age in records:
+            try:
+                ages.append(age)
+            except (TypeError, OverflowError):
+                raise _bad_age(name, age) from None
+            code = code_of.get(name)
+            if code is None:
+                code = code_of[name] = len(names)
+                names.append(name)
+            codes.append(code)
+
+    def _extend_encoded(self, names, codes, ages):
+        # A chunk that is already dictionary-encoded: remap its codes to ours
+        remap = []
+        for name in names:
+            code = self._code_of.get(name)
+            if code is None:
+                code = self._code_of[name] = len(self._names)
+                self._names.append(name)
+            remap.append(code)
+        self._codes.extend(map(remap.__getitem__, codes))
+        self._ages.extend(ages)
+
+    def __len__(self):
+        return len(self._ages)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("PersonTable index out of range")
+        return PersonRow(self, i)
+
+    def __iter__(self):
+        return map(PersonRow, repeat(self), range(len(self)))
+
+    def argsort(self):
+        """Row order by age: one sort over the age column, stable like sorted()."""
+        return array("I", sorted(range(len(self)), key=self._ages.__getitem__))
+
+    def sort(self):
+        """Reorder the table by age in place."""
+        order = self.argsort()
+        self._codes = array("I", map(self._codes.__getitem__, order))
+        self._ages = array("H", map(self._ages.__getitem__, order))
+
+    def nbytes(self):
+        """Approximate memory held by the table."""
+        return (sys.getsizeof(self._codes) + sys.getsizeof(self._ages)
+                + sys.getsizeof(self._names) + sys.getsizeof(self._code_of)
+                + sum(map(sys.getsizeof, self._names)))
+
+
+if __name__ == "__main__":
+    table = PersonTable.from_people(people)
+    print(table[0].greet())                       # >> Hello, I’m Alice and I’m 30 years old.
+    print(table[0] == alice_clone)                # >> True
+    print([str(table[i]) for i in table.argsort()])
+    # >> ['Bob (Homo sapiens, 25 years old)', 'Alice (...)', 'Alice (...)']
 
-# —————————————————————————————————————————————————————
-# 5. Context Management: __enter__ & __exit__
-# —————————————————————————————————————————————————————
-with Person("Bob", 25) as p:
-    print(p.greet())
-# >> [Entering context for Bob]
-# >> Hello, I’m Bob and I’m 25 years old.
-# >> [Exiting context for Bob]
 
 # —————————————————————————————————————————————————————
-# 6. Plain Getters & Setters
+# 10. Secondary indexes: PersonIndex
 # —————————————————————————————————————————————————————
-alice.set_name("Alicia")  
-print(alice.get_name())  # >> Alicia
+'''
+
+Person defines __eq__ without __hash__, so it is unhashable and "is this
+person already here?" means scanning a list. PersonIndex keeps hash indexes
+on (name, age) and on name plus a sorted age index for range queries.
+Renaming a person through the name setter updates every index that holds
+them; age is a plain attribute, so call refresh(p) after changing it.
+
+'''
+
+
+_index_registry = Person._index_registry
+
+
+class _PersonRef(weakref.ref):
+    # remembers the registry key, so one shared callback can drop the entry
+    __slots__ = ("key",)
+
+
+def _forget(ref):
+    _index_registry.pop(ref.key, None)
+
+
+def _register(p, index):
+    key = id(p)
+    entry = _index_registry.get(key)
+    if entry is None or entry[0]() is not p:
+        ref = _PersonRef(p, _forget)
+        ref.key = key
+        entry = _index_registry[key] = (ref, [])
+    entry[1].append(weakref.ref(index))
+
+
+def _unregister(p, index):
+    refs = _index_registry[id(p)][1]
+    del refs[next(i for i, ref in enumerate(refs) if ref() is index)]
+    if not refs:
+        del _index_registry[id(p)]
+
+
+class PersonIndex:
+    def __init__(self, people=()):
+        self._by_key = {}     # (name, age) -> [Person]
+        self._by_name = {}    # name -> [Person]
+        self._ages = []       # sorted (age, id) pairs
+        self._members = {}    # id -> (Person, indexed age)
+        for p in people:
+            if self._link(p):
+                self._ages.append((p.age, id(p)))
+        self._ages.sort()  # one sort, not an O(n) insort per person
+
+    def add(self, p):
+        if self._link(p):
+            insort(self._ages, (p.age, id(p)))
+
+    def _link(self, p):
+        # add() except for _ages; False if p is already indexed
+        if id(p) in self._members:
+            return False
+        self._members[id(p)] = (p, p.age)
+        self._by_key.setdefault((p.name, p.age), []).append(p)
+        self._by_name.setdefault(p.name, []).append(p)
+        _register(p, self)
+        return True
+
+    def remove(self, p):
+        p, age = self._members.pop(id(p))
+        self._unlink(self._by_key, (p.name, age), p)
+        self._unlink(self._by_name, p.name, p)
+        del self._ages[bisect_left(self._ages, (age, id(p)))]
+        _unregister(p, self)
+
+    def refresh(self, p):
+        """Re-index p after its age changed."""
+        self.remove(p)
+        self.add(p)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, p):
+        # Same meaning as `p in list`: is an equal person indexed?
+        return (p.name, p.age) in self._by_key
+
+    def find(self, name, age):
+        return list(self._by_key.get((name, age), ()))
+
+    def named(self, name):
+        return list(self._by_name.get(name, ()))
+
+    def between(self, lo, hi):
+        """People with lo <= age <= hi, youngest first."""
+        start = bisect_left(self._ages, (lo,))
+        stop = bisect_right(self._ages, (hi, float("inf")))
+        return [self._members[i][0] for _, i in self._ages[start:stop]]
+
+    @staticmethod
+    def _unlink(index, key, p):
+        bucket = index[key]
+        # by identity: list.remove() would drop the first *equal* person
+        del bucket[next(i for i, q in enumerate(bucket) if q is p)]
+        if not bucket:
+            del index[key]
+
+    def _renamed(self, p, old_name):
+        if id(p) not in self._members:
+            return
+        age = self._members[id(p)][1]
+        self._unlink(self._by_key, (old_name, age), p)
+        self._unlink(self._by_name, old_name, p)
+        self._by_key.setdefault((p.name, age), []).append(p)
+        self._by_name.setdefault(p.name, []).append(p)
+
+
+if __name__ == "__main__":
+    index = PersonIndex([alice, bob, charlie])
+    print(alice_clone in index)                   # >> True (equal, not identical)
+    bob.name = "Robert"                           # setter keeps the index current
+    print(index.named("Robert"), index.named("Bob"))
+    print([p.name for p in index.between(26, 30)])  # >> ['Charlie', 'Alice']
 
-print(Person.get_class_age())
 
 # —————————————————————————————————————————————————————
-# 7. @property Accessors (cleaner syntax)
+# 11. Sorting more people than fit in memory
 # —————————————————————————————————————————————————————
-alice.name = "Alice"     # calls @name.setter (with validation)
-print(alice.name)        # calls @property name
+'''
+
+sorted(people) needs the whole list in memory. external_sort() sorts
+`buffer_size` people at a time, spills each sorted run to a temporary file
+and then k-way merges the runs, at most `fan_in` at a time; with more runs
+than that it merges in several passes. The order is the same as sorted()
+with __lt__ (by age, ties keep input order). nsmallest / nlargest only ever
+hold k people.
+
+external_sort() keeps (name, age) pairs, not the people themselves, so it
+always yields new Person objects: the result does not depend on whether the
+input happened to fit in memory.
+
+'''
+_by_age = attrgetter("age")
+_record_age = itemgetter(1)
+
+
+def _write_run(path, records, batch):
+    import pickle
+    with open(path, "wb") as f:
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= batch:
+                pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+                chunk = []
+        if chunk:
+            pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    import pickle
+    with open(path, "rb") as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+def _merge_runs(paths):
+    return heapq.merge(*map(_read_run, paths), key=_record_age)
+
+
+def external_sort(people, buffer_size=100_000, fan_in=64):
+    """Yield people sorted by age as new Person objects.
+
+    At most ~buffer_size records are in memory and at most fan_in + 1 run
+    files are open at any time.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    it = iter(people)  # one iterator: a list must not restart after the first run
+    run = []
+    for p in it:
+        run.append((p.name, p.age))
+        if len(run) >= buffer_size:
+            break
+    else:  # everything fit: no files needed
+        run.sort(key=_record_age)
+        for name, age in run:
+            yield Person(name, age)
+        return
+
+    import itertools, os, tempfile  # only needed once a sort spills to disk
+    # each open run reads one batch at a time, so fan_in of them fit the budget
+    batch = max(1, buffer_size // fan_in)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, names = [], itertools.count()
+
+        def spill(records):
+            path = os.path.join(tmp, str(next(names)))
+            paths.append(_write_run(path, records, batch))
+
+        while run:
+            run.sort(key=_record_age)
+            spill(run)
+            run = []
+            for p in it:
+                run.append((p.name, p.age))
+                if len(run) >= buffer_size:
+                    break
+        while len(paths) > fan_in:
+            # merge consecutive groups so ties keep their input order
+            groups = [paths[i:i + fan_in] for i in range(0, len(paths), fan_in)]
+            paths = []
+            for group in groups:
+                spill(_merge_runs(group))
+                for path in group:
+                    os.remove(path)
+        for name, age in _merge_runs(paths):
+            yield Person(name, age)
+
+
+def nsmallest(k, people):
+    """The k youngest, like sorted(people)[:k] but holding only k people."""
+    return heapq.nsmallest(k, people, key=_by_age)
+
+
+def nlargest(k, people):
+    """The k oldest, like sorted(people, reverse=True)[:k]."""
+    return heapq.nlargest(k, people, key=_by_age)
+
+
+if __name__ == "__main__":
+    print([p.name for p in external_sort([alice, bob, charlie], buffer_size=2)])
+    # >> ['Robert', 'Charlie', 'Alice']
+    print(nlargest(1, [alice, bob, charlie]))
+
 
 # —————————————————————————————————————————————————————
-# 8. Static Method
+# 12. Bulk construction: from_records / from_csv
 # —————————————————————————————————————————————————————
-print(Person.is_valid_name("Eve"))    # >> True  
-print(Person.is_valid_name("Eve123")) # >> False  
\ No newline at end of file
+'''
+
+Person(name, age) runs the validating name setter once per object. The bulk
+constructors check a whole batch once and then fill each new object's
+__dict__ directly. from_csv streams the file in newline-aligned byte chunks
+(so quoted fields must not contain newlines). With workers > 1 the chunks
+are parsed in a process pool, at most 2 * workers in flight. Each worker
+returns its chunk dictionary-encoded (distinct names, codes, ages), so
+repeated names cross the process boundary only once per chunk.
+
+'''
+import csv
+import io
+from collections import deque
+
+CSV_CHUNK = 1 << 20  # bytes per parsed chunk
+
+
+def _check_names(names):
+    for name in names:
+        if not isinstance(name, str):
+            raise TypeError("Name must be a string")
+
+
+def _build_people(cls, records):
+    new = object.__new__
+    people = []
+    for name, age in records:
+        p = new(cls)
+        d = p.__dict__
+        d["_name"] = name
+        d["age"] = age
+        people.append(p)
+    return people
+
+
+def _read_chunks(path, header, chunk_size):
+    with open(path, "rb") as f:
+        if header:
+            f.readline()
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                return
+            if not data.endswith(b"\n"):
+                data += f.readline()  # finish the last line
+            yield data
+
+
+def _parse_chunk(data):
+    names, code_of = [], {}
+    codes, ages = array("I"), array("H")
+    # StringIO, not splitlines(): only the csv module decides where rows end
+    # ("\x85" and "\u2028" are ordinary characters inside a name)
+    for row in csv.reader(io.StringIO(data.decode(), newline="")):
+        if not row:
+            continue  # blank line
+        name, age = row
+        code = code_of.get(name)
+        if code is None:
+            code = code_of[name] = len(names)
+            names.append(name)
+        codes.append(code)
+        try:
+            ages.append(int(age))
+        except (ValueError, OverflowError):
+            raise ValueError(f"bad age {age!r} for {name!r}") from None
+    return names, codes, ages
+
+
+def _parse_csv(path, workers, header, chunk_size):
+    chunks = _read_chunks(path, header, chunk_size)
+    if workers <= 1:
+        yield from map(_parse_chunk, chunks)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for data in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_parse_chunk, data))
+        while pending:
+            yield pending.popleft().result()
+
+
+if __name__ == "__main__":
+    crowd = Person.from_records([("Dana", 41), ("Eve", 35)])
+    print(crowd[0].greet(), crowd[1] < alice)     # >> Hello, I’m Dana ... False
+    print(Person.from_records([("Dana", 41)], columnar=True)[0])
@@ -41,21 +41,22 @@ class Dog:
             print("Invalid age!")
 
 # Example Usage
-dog = Dog("Buddy", "Labrador", 3)
+if __name__ == "__main__":
+    dog = Dog("Buddy", "Labrador", 3)
 
-# Accessing public member
-print(dog.name)  # Accessible
+    # Accessing public member
+    print(dog.name)  # Accessible
 
-# Accessing protected member
-print(dog._breed)  # Accessible but discouraged outside the class
+    # Accessing protected member
+    print(dog._breed)  # Accessible but discouraged outside the class
 
-#print(dog.age) # raises error
-# Accessing private member using getter
-print(dog.get_age())
+    #print(dog.age) # raises error
+    # Accessing private member using getter
+    print(dog.get_age())
 
-# Modifying private member using setter
-dog.set_age(5)
-print(dog.get_info())
+    # Modifying private member using setter
+    dog.set_age(5)
+    print(dog.get_info())
 
 
 
@@ -87,7 +88,168 @@ class Example:
 
 
 
-e = Example()
-e.public_method()       # ✅ works
-e._protected_method()   # ⚠️ works, but “you shouldn’t” from outside
-e.__private_method()    # ❌ AttributeError!
+if __name__ == "__main__":
+    e = Example()
+    e.public_method()       # ✅ works
+    e._protected_method()   # ⚠️ works, but “you shouldn’t” from outside
+    try:
+        e.__private_method()    # ❌ AttributeError!
+    except AttributeError as err:
+        print("AttributeError:", err)
+
+
+
+'''
+
+Declarative validated fields
+
+Dog.set_age and the @property setters in magic_methods.py are hand-written
+checks that run a Python function on every write. @validated reads the
+Field(...) declarations of a class and, like dataclasses, generates its
+__init__ and one setter per field as source code with the checks inlined.
+Values live in `_<name>` (the same protected-attribute convention as
+above). Reads go through operator.attrgetter, so there is no Python-level
+getter.
+
+Validation can be turned off for trusted hot paths: for the whole process
+with `VALIDATE = False`, or for one block with `with trusted(): ...`. The
+block switch is a ContextVar, so it only covers the thread (or asyncio
+task) running the block, never code that runs alongside it.
+
+'''
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter
+
+VALIDATE = True
+_trusted = ContextVar("trusted", default=False)
+_in_trusted = _trusted.get  # what the generated code calls
+
+_BOUNDS = (("gt", ">"), ("ge", ">="), ("lt", "<"), ("le", "<="))
+
+
+def _type_name(t):
+    # isinstance() also takes tuples (and unions) of types, which have no __name__
+    return getattr(t, "__name__", repr(t))
+
+
+class Field:
+    """Declares a validated attribute: Field(int, gt=0)."""
+    __slots__ = ("type", "bounds", "default", "name")
+    _MISSING = object()
+
+    def __init__(self, type=object, *, gt=None, ge=None, lt=None, le=None,
+                 default=_MISSING):
+        self.type = type
+        given = {"gt": gt, "ge": ge, "lt": lt, "le": le}
+        self.bounds = {op: v for op, v in given.items() if v is not None}
+        self.default = default
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __repr__(self):
+        bounds = "".join(f", {op}={v!r}" for op, v in self.bounds.items())
+        return f"Field({_type_name(self.type)}{bounds})"
+
+    def _checks(self, var):
+        # Source lines validating `var`; constants come in as T_/gt_/... names
+        n, lines = self.name, []
+        if self.type is not object:
+            lines.append(f"if not isinstance({var}, T_{n}): "
+                         f"raise TypeError({n + ' must be ' + _type_name(self.type)!r})")
+        for op, sym in _BOUNDS:
+            if op in self.bounds:
+                msg = f"{n} must be {sym} {self.bounds[op]!r}"
+                lines.append(f"if not {var} {sym} {op}_{n}: raise ValueError({msg!r})")
+        return lines
+
+
+def _fields(cls):
+    found = {}
+    for klass in reversed(cls.__mro__):
+        found.update(klass.__dict__.get("__fields__", {}))
+        found.update((k, v) for k, v in klass.__dict__.items() if isinstance(v, Field))
+    return found
+
+
+def _generate(fields, own):
+    consts = {}
+    for f in fields.values():
+        consts[f"T_{f.name}"] = f.type
+        consts.update((f"{op}_{f.name}", v) for op, v in f.bounds.items())
+        if f.default is not Field._MISSING:
+            consts[f"D_{f.name}"] = f.default
+
+    params, seen_default = [], False
+    for f in fields.values():
+        if f.default is not Field._MISSING:
+            params.append(f"{f.name}=D_{f.name}")
+            seen_default = True
+        elif seen_default:
+            raise TypeError(f"non-default field {f.name!r} follows a default field")
+        else:
+            params.append(f.name)
+
+    checks = [f"        {line}" for f in fields.values() for line in f._checks(f.name)]
+    body = ["    if VALIDATE and not _in_trusted():", *checks] if checks else []
+    body += [f"    self._{f.name} = {f.name}" for f in fields.values()] or ["    pass"]
+    src = [f"def __init__(self, {', '.join(params)}):", *body]
+    for f in own:
+        checks = [f"        {line}" for line in f._checks("value")]
+        src.append(f"def set_{f.name}(self, value):")
+        src += ["    if VALIDATE and not _in_trusted():", *checks] if checks else []
+        src.append(f"    self._{f.name} = value")
+
+    # Wrapped in a factory so the constants are closure cells, not globals
+    names = ", ".join(consts)
+    factory = [f"def __create__({names}):"]
+    factory += [f"    {line}" for line in src]
+    setters = "".join(f"set_{f.name}, " for f in own)
+    factory.append(f"    return __init__, ({setters})")
+    ns = {}
+    exec("\n".join(factory), globals(), ns)
+    return ns["__create__"](**consts)
+
+
+def validated(cls):
+    """Class decorator: generate __init__ and setters from Field declarations."""
+    fields = _fields(cls)
+    own = [f for f in fields.values() if f.name in cls.__dict__]
+    init, setters = _generate(fields, own)
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    cls.__init__ = init
+    cls.__fields__ = {f.name: f for f in own}
+    for f, setter in zip(own, setters):
+        setter.__qualname__ = f"{cls.__qualname__}.{f.name}"
+        setattr(cls, f.name, property(attrgetter(f"_{f.name}"), setter, doc=repr(f)))
+    return cls
+
+
+@contextmanager
+def trusted():
+    """Skip Field validation inside the block (this thread / task only)."""
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+@validated
+class Pet:
+    name = Field(str)
+    age = Field(int, gt=0)
+
+
+if __name__ == "__main__":
+    pet = Pet("Buddy", 3)
+    pet.age = 5
+    print(pet.name, pet.age)                 # >> Buddy 5
+    try:
+        pet.age = -1
+    except ValueError as err:
+        print("ValueError:", err)            # >> ValueError: age must be > 0
+    with trusted():
+        print(Pet("Rex", -1).age)            # >> -1 (no checks in the block)
@@ -31,7 +31,8 @@ class Car:
         return f"{ignition} Driving a {self.make} {self.model}"
 
 # Usage
-e = Engine(300)
-c = Car("Ford", "Mustang", e)
-print(c.drive())
-# Engine with 300 HP started. Driving a Ford Mustang
+if __name__ == "__main__":
+    e = Engine(300)
+    c = Car("Ford", "Mustang", e)
+    print(c.drive())
+    # Engine with 300 HP started. Driving a Ford Mustang
@@ -45,7 +45,8 @@ MRO determines the order in which methods are resolved when multiple inheritance
 Use the __mro__ attribute or mro() method to inspect the MRO of a class
 '''
 
-print(D.__mro__)
+if __name__ == "__main__":
+    print(D.__mro__)
 
-import inspect
-print(inspect.getmro(D))
+    import inspect
+    print(inspect.getmro(D))
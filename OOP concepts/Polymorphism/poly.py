@@ -43,8 +43,72 @@ def make_it_speak(animal: Animal):
     print(animal.speak())
 
 # Usage
-make_it_speak(Dog())  # Woof!
-make_it_speak(Cat())  # Meow!
+if __name__ == "__main__":
+    make_it_speak(Dog())  # Woof!
+    make_it_speak(Cat())  # Meow!
+
+
+# Batch dispatch: the same polymorphic call on a whole mixed list, for
+# classes that can do it cheaper per group than per object. A class opts in
+# with a `<method>_batch` classmethod taking a list of its instances (one
+# INSERT for all of them instead of one each, say). The dispatcher groups
+# the objects of such classes by type, calls the hook once per group and
+# scatters the results back to their positions (like ShapeCollection.areas);
+# everything else gets the ordinary per-object call. Results come back in
+# input order.
+#
+# Grouping costs several times a cheap method call, so it only pays when a
+# hook saves real work per object. Without hooks the dispatcher just runs
+# the plain loop you would write by hand, [o.speak() for o in objects],
+# after one pass to see which types are present.
+
+_plain_loops = {}  # method name -> compiled [o.<name>() for o in objects]
+
+class BatchDispatcher:
+    def __init__(self, method):
+        if not method.isidentifier():
+            raise ValueError(f"not a method name: {method!r}")
+        self.method = method
+        self.hook = method + "_batch"
+        self._hooks = {}  # type -> its hook, or None
+        loop = _plain_loops.get(method)
+        if loop is None:
+            ns = {}
+            exec(f"def loop(objects):\n    return [o.{method}() for o in objects]\n", ns)
+            loop = _plain_loops[method] = ns["loop"]
+        self._loop = loop
+
+    def _hook(self, cls):
+        try:
+            return self._hooks[cls]
+        except KeyError:
+            hook = self._hooks[cls] = getattr(cls, self.hook, None)
+            return hook
+
+    def __call__(self, objects):
+        if not isinstance(objects, list):
+            objects = list(objects)
+        kinds = set(map(type, objects))
+        hooks = {cls: hook for cls in kinds if (hook := self._hook(cls)) is not None}
+        if not hooks:
+            return self._loop(objects)
+        if len(kinds) == 1:
+            return list(hooks.popitem()[1](objects))
+        positions = {cls: [] for cls in kinds}
+        for i, cls in enumerate(map(type, objects)):
+            positions[cls].append(i)
+        out = [None] * len(objects)
+        for cls, where in positions.items():
+            group = list(map(objects.__getitem__, where))
+            hook = hooks.get(cls)
+            results = hook(group) if hook is not None else self._loop(group)
+            for i, result in zip(where, results):
+                out[i] = result
+        return out
+
+if __name__ == "__main__":
+    speak_all = BatchDispatcher("speak")
+    print(speak_all([Dog(), Cat(), Dog()]))  # ['Woof!', 'Meow!', 'Woof!']
 
 
 
@@ -64,8 +128,9 @@ def in_pond(thing):
     thing.quack()  
     thing.swim()
 
-in_pond(Duck())    # Quack! Splash
-in_pond(Person())  # I can quack, too! I can swim
+if __name__ == "__main__":
+    in_pond(Duck())    # Quack! Splash
+    in_pond(Person())  # I can quack, too! I can swim
 
 
 # Operator Overloading
@@ -73,19 +138,301 @@ in_pond(Person())  # I can quack, too! I can swim
 
 
 class Vector:
+    __slots__ = ("x", "y")  # no per-instance __dict__
+
     def __init__(self, x, y):
         self.x, self.y = x, y
 
     def __add__(self, other):
-        # vector + vector → new vector
-        return Vector(self.x + other.x, self.y + other.y)
+        # Duck typed: anything with .x and .y adds like a vector, except types
+        # that flag _adds_vectors (the batch and lazy types below): they
+        # answer with their own __radd__
+        if getattr(other, "_adds_vectors", False):
+            return NotImplemented
+        try:
+            ox, oy = other.x, other.y
+        except AttributeError:
+            return NotImplemented
+        return Vector(self.x + ox, self.y + oy)
 
     def __repr__(self):
         return f"Vector({self.x}, {self.y})"
 
-v1 = Vector(1, 2)
-v2 = Vector(3, 4)
-print(v1 + v2)   # Vector(4, 6)
+if __name__ == "__main__":
+    v1 = Vector(1, 2)
+    v2 = Vector(3, 4)
+    print(v1 + v2)   # Vector(4, 6)
+
+
+# Operator overloading works just as well on a whole batch of vectors.
+# VectorBatch keeps all x's in one array and all y's in another
+# (struct-of-arrays), so a million vectors are two flat buffers instead of
+# a million objects, and `batch + batch` is one pass over them.
+
+from array import array
+from math import hypot, sqrt
+from operator import add, sub
+
+class VectorBatch:
+    __slots__ = ("xs", "ys")
+    _adds_vectors = True  # Vector + batch broadcasts here, see Vector.__add__
+
+    def __init__(self, xs=(), ys=()):
+        self.xs = xs if isinstance(xs, array) and xs.typecode == "d" else array("d", xs)
+        self.ys = ys if isinstance(ys, array) and ys.typecode == "d" else array("d", ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        xs, ys = array("d"), array("d")
+        for v in vectors:
+            xs.append(v.x)
+            ys.append(v.y)
+        return cls(xs, ys)
+
+    def to_vectors(self):
+        return list(map(Vector, self.xs, self.ys))
+
+    def append(self, v):
+        self.xs.append(v.x)
+        self.ys.append(v.y)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):  # array slices are copies, like list slices
+            return VectorBatch(self.xs[i], self.ys[i])
+        return Vector(self.xs[i], self.ys[i])
+
+    def __iter__(self):
+        return map(Vector, self.xs, self.ys)
+
+    def __repr__(self):
+        return f"VectorBatch(n={len(self)})"
+
+    # ——— element-wise arithmetic ———
+
+    def _combine(self, other, op):
+        if isinstance(other, Vector):  # broadcast one vector over the batch
+            ox, oy = other.x, other.y
+            return VectorBatch(array("d", [op(x, ox) for x in self.xs]),
+                               array("d", [op(y, oy) for y in self.ys]))
+        if isinstance(other, VectorBatch):
+            if len(other) != len(self):
+                raise ValueError("VectorBatch lengths differ")
+            return VectorBatch(array("d", map(op, self.xs, other.xs)),
+                               array("d", map(op, self.ys, other.ys)))
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._combine(other, add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._combine(other, sub)
+
+    def __mul__(self, k):
+        if not isinstance(k, (int, float)):
+            return NotImplemented
+        return VectorBatch(array("d", [x * k for x in self.xs]),
+                           array("d", [y * k for y in self.ys]))
+
+    __rmul__ = __mul__
+
+    def __iadd__(self, other):
+        # Updates the existing buffers: no new batch, no new arrays
+        xs, ys = self.xs, self.ys
+        if isinstance(other, Vector):
+            ox, oy = other.x, other.y
+            for i in range(len(xs)):
+                xs[i] += ox
+                ys[i] += oy
+        elif isinstance(other, VectorBatch):
+            if len(other) != len(self):
+                raise ValueError("VectorBatch lengths differ")
+            for i, (ox, oy) in enumerate(zip(other.xs, other.ys)):
+                xs[i] += ox
+                ys[i] += oy
+        else:
+            return NotImplemented
+        return self
+
+    # ——— reductions ———
+
+    def sum(self):
+        return Vector(sum(self.xs), sum(self.ys))
+
+    def norms(self):
+        """Length of every vector in the batch."""
+        return array("d", map(hypot, self.xs, self.ys))
+
+    def norm(self):
+        """Euclidean norm of the whole batch taken as one long vector."""
+        return sqrt(sum([x * x for x in self.xs]) + sum([y * y for y in self.ys]))
+
+if __name__ == "__main__":
+    batch = VectorBatch.from_vectors([v1, v2])
+    print(batch + v1)             # VectorBatch(n=2)
+    print((batch + batch).sum())  # Vector(8.0, 12.0)
+
+
+# Lazy (opt-in) operator overloading: instead of computing right away,
+# lazy(v) + ... returns an expression. Nothing is added up until .eval()
+# (or .x / .y) is read; then the whole chain runs as one compiled function,
+# so `lazy(v1) + v2 + v3 + v4` makes one Vector instead of three.
+# An expression is only two things: the list of leaves it reads and a small
+# int naming its shape. Shapes are interned as they are built: (left shape,
+# right shape, op) -> shape, so `expr + v` is one dict lookup plus an append
+# (in place when nothing else has extended the leaf list yet), and eval()
+# finds the compiled function by shape without rendering any source. Leaves
+# are read by reference, so an expression built once can be re-evaluated
+# every step of a loop, and eval(out=v) writes into an existing Vector.
+# That reuse is where the speed is: rebuilding an expression for a single
+# eval() is still a Python call per `+`, just like the eager chain.
+
+_VECTOR, _NUMBER = 0, 1     # leaf shapes
+_shape_ids = {}             # (left, right, op) -> shape
+_shape_parts = [None, None] # shape -> (left, right, op); None for leaves
+_compiled = {}              # shape -> evaluator, shared by every expression of that shape
+_new = object.__new__
+
+def _shape(left, right, op):
+    key = (left, right, op)
+    shape = _shape_ids.get(key)
+    if shape is None:
+        shape = _shape_ids[key] = len(_shape_parts)
+        _shape_parts.append(key)
+    return shape
+
+class VectorExpr:
+    __slots__ = ("_shape", "_leaves", "_m")
+    _adds_vectors = True  # Vector + expr stays lazy, see Vector.__add__
+
+    def __init__(self, v):
+        self._shape, self._leaves, self._m = _VECTOR, [v], 1
+
+    def _combine(self, shape, leaves, op):
+        # self's leaves then `leaves`; the list is shared with self unless
+        # another expression already appended past self's end.
+        mine = self._leaves
+        if len(mine) != self._m:
+            mine = mine[:self._m]
+        mine += leaves
+        expr = _new(VectorExpr)
+        expr._shape, expr._leaves, expr._m = _shape(self._shape, shape, op), mine, len(mine)
+        return expr
+
+    def _binary(self, other, op, reflected=False):
+        if isinstance(other, Vector):
+            shape, leaves = _VECTOR, [other]
+        elif isinstance(other, VectorExpr):
+            shape, leaves = other._shape, other._leaves[:other._m]
+        else:
+            return NotImplemented
+        if not reflected:
+            return self._combine(shape, leaves, op)
+        expr = _new(VectorExpr)
+        expr._leaves = leaves + self._leaves[:self._m]
+        expr._shape, expr._m = _shape(shape, self._shape, op), len(expr._leaves)
+        return expr
+
+    def __add__(self, other):
+        if type(other) is not Vector:  # hot path below: expr + vector
+            return self._binary(other, "+")
+        leaves = self._leaves
+        if len(leaves) != self._m:
+            leaves = leaves[:self._m]
+        leaves.append(other)
+        key = (self._shape, _VECTOR, "+")
+        shape = _shape_ids.get(key)
+        expr = _new(VectorExpr)
+        expr._shape = _shape(*key) if shape is None else shape
+        expr._leaves, expr._m = leaves, len(leaves)
+        return expr
+
+    def __radd__(self, other):
+        return self._binary(other, "+", reflected=True)
+
+    def __sub__(self, other):
+        return self._binary(other, "-")
+
+    def __rsub__(self, other):
+        return self._binary(other, "-", reflected=True)
+
+    def __mul__(self, k):
+        if not isinstance(k, (int, float)):
+            return NotImplemented
+        return self._combine(_NUMBER, [k], "*")
+
+    __rmul__ = __mul__
+
+    def eval(self, out=None):
+        fn = _compiled.get(self._shape)
+        if fn is None:
+            fn = _compiled[self._shape] = _compile(self._shape)
+        leaves = self._leaves
+        return fn(out, *(leaves if len(leaves) == self._m else leaves[:self._m]))
+
+    @property
+    def x(self):
+        return self.eval().x
+
+    @property
+    def y(self):
+        return self.eval().y
+
+    def __repr__(self):
+        names, expr = _render(self._shape)
+        return f"VectorExpr({expr})".replace(".\0", "")
+
+def _render(shape):
+    # shape -> (parameter names, infix source); "\0" stands for the
+    # component (x or y) being computed. Parentheses keep the exact order of
+    # the eager operations. Walked with an explicit stack: chains can be long.
+    names, done, todo = [], [], [shape]
+    while todo:
+        item = todo.pop()
+        if isinstance(item, str):  # both operands rendered: combine them
+            right, rprec = done.pop()
+            left, lprec = done.pop()
+            prec = 2 if item == "*" else 1
+            if lprec < prec:
+                left = f"({left})"
+            if rprec <= prec:
+                right = f"({right})"
+            done.append((f"{left} {item} {right}", prec))
+        elif item in (_VECTOR, _NUMBER):
+            name = f"{'v' if item == _VECTOR else 'k'}{len(names)}"
+            names.append(name)
+            done.append((f"{name}.\0" if item == _VECTOR else name, 3))
+        else:
+            left, right, op = _shape_parts[item]
+            todo += (op, right, left)
+    return names, done[0][0]
+
+def _compile(shape):
+    names, expr = _render(shape)
+    src = (f"def evaluate(out, {', '.join(names)}):\n"
+           f"    x = {expr.replace(chr(0), 'x')}\n"
+           f"    y = {expr.replace(chr(0), 'y')}\n"
+           f"    if out is None:\n"
+           f"        return Vector(x, y)\n"
+           f"    out.x, out.y = x, y\n"
+           f"    return out\n")
+    namespace = {"Vector": Vector}
+    exec(src, namespace)
+    return namespace["evaluate"]
+
+def lazy(v):
+    return VectorExpr(v)
+
+if __name__ == "__main__":
+    v3 = Vector(5, 6)
+    total = lazy(v1) + v2 + v3   # nothing computed yet
+    print(total.eval())          # Vector(9, 12)
 
 
 
@@ -12,9 +12,308 @@ class Point:
     x: float
     y: float
 
-p1 = Point(1, 2)
-print(p1)              # Point(x=1, y=2)
-print(p1 == Point(1,2))  # True
+if __name__ == "__main__":
+    p1 = Point(1, 2)
+    print(p1)              # Point(x=1, y=2)
+    print(p1 == Point(1,2))  # True
+
+
+'''
+dataclass options (Python 3.10+): frozen=True makes instances immutable (and
+hashable), slots=True generates __slots__ so there is no per-instance __dict__.
+'''
+@dataclass(frozen=True, slots=True)
+class FastPoint:
+    x: float
+    y: float
+
+
+'''
+Many points, one buffer: PointArray keeps x0, y0, x1, y1, ... in a single
+contiguous array('d') instead of one object per point. memoryview() exposes
+the raw buffer, so it can go to a file or socket without copying, and
+from_buffer / from_file wrap existing bytes (native-endian doubles) instead
+of parsing them.
+'''
+import mmap
+from array import array
+
+
+class PointArray:
+    __slots__ = ("_data",)
+
+    def __init__(self, points=()):
+        self._data = array("d")
+        for p in points:
+            self._data.append(p.x)
+            self._data.append(p.y)
+
+    @classmethod
+    def from_buffer(cls, buf):
+        """Wrap any bytes-like object of packed doubles; nothing is copied."""
+        view = memoryview(buf).cast("B")
+        if len(view) % 16:
+            raise ValueError("buffer size must be a multiple of 16 bytes (one x/y pair)")
+        self = cls.__new__(cls)
+        self._data = view.cast("d")
+        return self
+
+    @classmethod
+    def from_file(cls, path):
+        """Memory-map a file written by write_to(); pages load on first access."""
+        with open(path, "rb") as f:
+            if not f.seek(0, 2):
+                return cls()
+            return cls.from_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def memoryview(self):
+        return memoryview(self._data)
+
+    def write_to(self, f):
+        f.write(self.memoryview())
+
+    @property
+    def xs(self):
+        return self.memoryview()[0::2]  # strided view, no copy
+
+    @property
+    def ys(self):
+        return self.memoryview()[1::2]
+
+    def append(self, p):
+        if not isinstance(self._data, array):
+            self._data = array("d", self._data)  # foreign buffers are fixed-size: copy once
+        self._data.append(p.x)
+        self._data.append(p.y)
+
+    def __len__(self):
+        return len(self._data) // 2
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("PointArray index out of range")
+        return FastPoint(self._data[2 * i], self._data[2 * i + 1])
+
+    def __setitem__(self, i, p):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("PointArray index out of range")
+        self._data[2 * i] = p.x
+        self._data[2 * i + 1] = p.y
+
+    def __iter__(self):
+        it = iter(self._data)
+        return map(FastPoint, it, it)
+
+    def __repr__(self):
+        return f"PointArray(n={len(self)})"
+
+
+if __name__ == "__main__":
+    pts = PointArray([p1, FastPoint(3, 4)])
+    copy = PointArray.from_buffer(pts.memoryview().tobytes())
+    print(list(copy))        # [FastPoint(x=1.0, y=2.0), FastPoint(x=3.0, y=4.0)]
+
+
+'''
+Spatial indexes: answering "which points are near here?" without scanning
+every point. Both return indexes into the points they were given (a list of
+Points or a PointArray).
+
+KDTree   built once from all points; the tree is implicit in the order of
+         its arrays (the median of each range is the node), so there are no
+         node objects at all.
+UniformGrid  buckets points into square cells; add / move / remove are
+         O(1), queries search outwards ring by ring.
+'''
+import heapq
+from math import floor
+
+
+class KDTree:
+    def __init__(self, points):
+        self.points = points
+        order = list(range(len(points)))
+        xs = [p.x for p in points]
+        ys = [p.y for p in points]
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if hi - lo <= 1:
+                continue
+            coord = xs if axis == 0 else ys
+            order[lo:hi] = sorted(order[lo:hi], key=coord.__getitem__)
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, axis ^ 1))
+            stack.append((mid + 1, hi, axis ^ 1))
+        self._ids = array("l", order)
+        self._xs = array("d", [xs[i] for i in order])
+        self._ys = array("d", [ys[i] for i in order])
+
+    def __len__(self):
+        return len(self._ids)
+
+    def nearest(self, x, y):
+        found = self.k_nearest(x, y, 1)
+        return found[0] if found else None
+
+    def k_nearest(self, x, y, k):
+        """Indexes of the k points closest to (x, y), closest first."""
+        if k <= 0:
+            return []
+        xs, ys = self._xs, self._ys
+        best = []  # max-heap of (-dist2, -pos)
+        stack = [(0, len(xs), 0, 0.0)]
+        while stack:
+            lo, hi, axis, bound = stack.pop()
+            if lo >= hi or (len(best) == k and bound >= -best[0][0]):
+                continue
+            mid = (lo + hi) // 2
+            dx, dy = xs[mid] - x, ys[mid] - y
+            d2 = dx * dx + dy * dy
+            if len(best) < k:
+                heapq.heappush(best, (-d2, -mid))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, -mid))
+            diff = dx if axis == 0 else dy
+            near, far = ((lo, mid), (mid + 1, hi)) if diff > 0 else ((mid + 1, hi), (lo, mid))
+            # far side first on the stack so the near side is searched first
+            stack.append((far[0], far[1], axis ^ 1, diff * diff))
+            stack.append((near[0], near[1], axis ^ 1, 0.0))
+        return [self._ids[-pos] for _, pos in sorted(best, reverse=True)]
+
+    def within(self, xmin, ymin, xmax, ymax):
+        """Indexes of points inside the rectangle (edges included)."""
+        xs, ys, out = self._xs, self._ys, []
+        stack = [(0, len(xs), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            px, py = xs[mid], ys[mid]
+            if xmin <= px <= xmax and ymin <= py <= ymax:
+                out.append(self._ids[mid])
+            v, vmin, vmax = (px, xmin, xmax) if axis == 0 else (py, ymin, ymax)
+            if vmin <= v:
+                stack.append((lo, mid, axis ^ 1))
+            if v <= vmax:
+                stack.append((mid + 1, hi, axis ^ 1))
+        return out
+
+
+class UniformGrid:
+    def __init__(self, cell_size, points=()):
+        self.cell_size = cell_size
+        self._cells = {}    # (cx, cy) -> [id]
+        self._where = {}    # id -> (x, y)
+        self._next_id = 0
+        for p in points:
+            self.add(p)
+
+    def __len__(self):
+        return len(self._where)
+
+    def _cell(self, x, y):
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def add(self, p):
+        """Insert a point; returns its id (its index when built from a list)."""
+        pid = self._next_id
+        self._next_id += 1
+        self._where[pid] = (p.x, p.y)
+        self._cells.setdefault(self._cell(p.x, p.y), []).append(pid)
+        return pid
+
+    def remove(self, pid):
+        x, y = self._where.pop(pid)
+        cell = self._cell(x, y)
+        bucket = self._cells[cell]
+        bucket.remove(pid)
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, pid, p):
+        x, y = self._where[pid]
+        self._where[pid] = (p.x, p.y)
+        old, new = self._cell(x, y), self._cell(p.x, p.y)
+        if old != new:
+            bucket = self._cells[old]
+            bucket.remove(pid)
+            if not bucket:
+                del self._cells[old]
+            self._cells.setdefault(new, []).append(pid)
+
+    def nearest(self, x, y):
+        found = self.k_nearest(x, y, 1)
+        return found[0] if found else None
+
+    def k_nearest(self, x, y, k):
+        if k <= 0 or not self._cells:
+            return []
+        cx, cy = self._cell(x, y)
+        best, r = [], 0
+
+        def visit(cell):
+            for pid in self._cells[cell]:
+                px, py = self._where[pid]
+                d2 = (px - x) ** 2 + (py - y) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-d2, pid))
+                elif d2 < -best[0][0]:
+                    heapq.heapreplace(best, (-d2, pid))
+
+        while True:
+            if (2 * r + 1) ** 2 > len(self._cells):
+                # rings 0..r hold more cells than are occupied (a far query):
+                # walk the occupied cells not visited yet and stop
+                for a, b in self._cells:
+                    if max(abs(a - cx), abs(b - cy)) >= r:
+                        visit((a, b))
+                break
+            for cell in self._ring(cx, cy, r):
+                if cell in self._cells:
+                    visit(cell)
+            # every point in ring r+1 is at least r cells away
+            reach = r * self.cell_size
+            if len(best) == k and -best[0][0] <= reach * reach:
+                break
+            r += 1
+        return [pid for _, pid in sorted(best, key=lambda e: (-e[0], e[1]))]
+
+    @staticmethod
+    def _ring(cx, cy, r):
+        if r == 0:
+            yield cx, cy
+            return
+        for i in range(-r, r + 1):
+            yield cx + i, cy - r
+            yield cx + i, cy + r
+        for j in range(-r + 1, r):
+            yield cx - r, cy + j
+            yield cx + r, cy + j
+
+    def within(self, xmin, ymin, xmax, ymax):
+        (x0, y0), (x1, y1) = self._cell(xmin, ymin), self._cell(xmax, ymax)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self._cells):
+            cells = ((a, b) for a in range(x0, x1 + 1) for b in range(y0, y1 + 1))
+        else:  # huge rectangle: cheaper to walk the occupied cells
+            cells = (c for c in self._cells if x0 <= c[0] <= x1 and y0 <= c[1] <= y1)
+        out = []
+        for cell in cells:
+            for pid in self._cells.get(cell, ()):
+                px, py = self._where[pid]
+                if xmin <= px <= xmax and ymin <= py <= ymax:
+                    out.append(pid)
+        return out
+
+
+if __name__ == "__main__":
+    tree = KDTree([Point(0, 0), Point(5, 5), Point(1, 2)])
+    print(tree.nearest(1, 1), tree.within(0, 0, 2, 2))  # 2 [2, 0]
 
 
 '''
@@ -25,6 +324,174 @@ class Node:
     def __init__(self, value):
         self.value = value
         self.next = None
-        self.other = 1 # AttributeError: 'Node' object has no attribute 'other'
 
-n = Node(5)
+if __name__ == "__main__":
+    n = Node(5)
+    try:
+        n.other = 1
+    except AttributeError as e:
+        print(e)  # 'Node' object has no attribute 'other'
+
+
+'''
+Slotted nodes put to work: a doubly linked list.
+
+DNode only adds a `prev` slot to Node. Popped nodes go on a free list
+(chained through .next) and are reused by the next append, so a list that
+keeps growing and shrinking stops allocating. extend() builds the whole new
+chain first and links it in once, and splice() moves every node of another
+list over in O(1).
+
+append() and appendleft() return nothing, like deque's. append_node(),
+appendleft_node() and insert_after() return the new node as a handle for
+remove_node()/insert_after(). A handle must never come back as some other
+value, so once a list has handed one out it stops recycling nodes: removed
+nodes are dropped with prev=None, and passing one in again raises ValueError.
+'''
+class DNode(Node):
+    __slots__ = ("prev",)
+    def __init__(self, value):
+        super().__init__(value)
+        self.prev = None
+
+
+class LinkedList:
+    node_type = DNode
+
+    def __init__(self, iterable=(), max_free=1024):
+        self._head = self.node_type(None)  # sentinel: head.next is first, head.prev is last
+        self._head.next = self._head.prev = self._head
+        self._len = 0
+        self._free = None                  # free list of spare nodes
+        self._free_len = 0
+        self.max_free = max_free
+        self._handles = False              # set once a node was handed out
+        self.extend(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        node, head = self._head.next, self._head
+        while node is not head:
+            yield node.value
+            node = node.next
+
+    def __repr__(self):
+        return f"LinkedList({list(self)!r})"
+
+    def _new(self, value):
+        node = self._free
+        if node is None:
+            return self.node_type(value)
+        self._free = node.next
+        self._free_len -= 1
+        node.value = value
+        return node
+
+    def _release(self, node):
+        value = node.value
+        node.value = node.prev = None  # don't keep the value alive
+        if not self._handles and self._free_len < self.max_free:
+            node.next = self._free
+            self._free = node
+            self._free_len += 1
+        else:
+            node.next = None
+        return value
+
+    def _link_after(self, where, first, last, count):
+        after = where.next
+        where.next, first.prev = first, where
+        last.next, after.prev = after, last
+        self._len += count
+
+    def _unlink(self, node):
+        if node is self._head:
+            raise IndexError("pop from an empty LinkedList")
+        node.prev.next, node.next.prev = node.next, node.prev
+        self._len -= 1
+        return self._release(node)
+
+    def _live(self, node):
+        if node.prev is None:
+            raise ValueError("node was already removed from its LinkedList")
+        return node
+
+    def append(self, value):
+        node = self._new(value)
+        self._link_after(self._head.prev, node, node, 1)
+
+    def appendleft(self, value):
+        node = self._new(value)
+        self._link_after(self._head, node, node, 1)
+
+    def append_node(self, value):
+        self._handles = True
+        node = self._new(value)
+        self._link_after(self._head.prev, node, node, 1)
+        return node
+
+    def appendleft_node(self, value):
+        self._handles = True
+        node = self._new(value)
+        self._link_after(self._head, node, node, 1)
+        return node
+
+    def insert_after(self, node, value):
+        self._handles = True
+        new = self._new(value)
+        self._link_after(self._live(node), new, new, 1)
+        return new
+
+    def extend(self, iterable):
+        first = last = None
+        count = 0
+        for value in iterable:
+            node = self._new(value)
+            if first is None:
+                first = node
+            else:
+                last.next, node.prev = node, last
+            last = node
+            count += 1
+        if first is not None:
+            self._link_after(self._head.prev, first, last, count)
+
+    def pop(self):
+        return self._unlink(self._head.prev)
+
+    def popleft(self):
+        return self._unlink(self._head.next)
+
+    def remove_node(self, node):
+        """O(1) removal of a node (from append_node/appendleft_node/insert_after) still in this list."""
+        return self._unlink(self._live(node))
+
+    def splice(self, other):
+        """Move all of other's nodes to the end of this list in O(1)."""
+        if other is self or not other._len:
+            return
+        oh = other._head
+        self._handles |= other._handles
+        self._link_after(self._head.prev, oh.next, oh.prev, other._len)
+        oh.next = oh.prev = oh
+        other._len = 0
+
+    def clear(self):
+        while self._len:
+            self.pop()
+
+
+if __name__ == "__main__":
+    ll = LinkedList([1, 2, 3])
+    ll.appendleft(0)
+    ll.splice(LinkedList([4, 5]))
+    print(ll)                  # LinkedList([0, 1, 2, 3, 4, 5])
+    print(ll.pop(), ll.popleft())  # 5 0
+    n = ll.append_node(6)
+    ll.remove_node(n)
+    try:
+        ll.remove_node(n)
+    except ValueError as e:
+        print(e)               # node was already removed from its LinkedList
@@ -0,0 +1,28 @@
+'''
+Shared helpers for the benchmark scripts.
+
+Importing this module puts the repository root on sys.path, so the
+scripts can `from oop_tutorial import SOLID` without installing anything.
+'''
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def best_of(fn, repeat=3):
+    """Best wall-clock time of fn() over `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def row(*cols, width=14):
+    print("".join(str(c).ljust(width) for c in cols))
@@ -0,0 +1,68 @@
+'''
+Aggregate throughput of many concurrent AsyncFileHandler readers and writers
+on one event loop, for several thread-pool sizes. Also reports the worst
+event-loop stall seen by a ticker task, i.e. how responsive the loop stays.
+
+    python benchmarks/bench_async_io.py [tasks] [files]
+'''
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import row
+
+from oop_tutorial import SOLID
+
+PAYLOAD = os.urandom(256 * 1024)
+
+
+async def ticker(stop, worst):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst[0] = max(worst[0], time.perf_counter() - start - 0.001)
+
+
+async def run(tmp, tasks, files, workers):
+    pool = ThreadPoolExecutor(workers)
+    handlers = [SOLID.AsyncFileHandler(os.path.join(tmp, f"f{i}.bin"), executor=pool)
+                for i in range(files)]
+    for h in handlers:
+        with open(h.path, "wb") as f:
+            f.write(PAYLOAD * 4)
+    moved = [0]
+
+    async def reader(h):
+        async for chunk in h.chunks(256 * 1024):
+            moved[0] += len(chunk)
+
+    async def writer(h):
+        for _ in range(4):
+            moved[0] += await h.write(PAYLOAD)
+
+    stop, worst = asyncio.Event(), [0.0]
+    tick = asyncio.create_task(ticker(stop, worst))
+    start = time.perf_counter()
+    await asyncio.gather(*(reader(handlers[i % files]) if i % 2 else writer(handlers[i % files])
+                           for i in range(tasks)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    pool.shutdown()
+    return moved[0] / elapsed / 1e6, worst[0] * 1e3
+
+
+def main(tasks=200, files=20):
+    row("pool threads", "MB/s", "worst stall ms", width=16)
+    for workers in (1, 2, 4, 8, 16):
+        with tempfile.TemporaryDirectory() as tmp:
+            rate, stall = asyncio.run(run(tmp, tasks, files, workers))
+        row(workers, f"{rate:,.0f}", f"{stall:.1f}", width=16)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+'''
+Per-item checkout() over a chain of discounts vs DiscountPipeline, for
+chains of 1-20 discounts (checks the outputs are identical).
+
+    python benchmarks/bench_discounts.py [amounts]
+'''
+
+import random
+import sys
+from decimal import Decimal
+
+from _common import best_of, row
+
+from oop_tutorial import SOLID
+
+
+class Loyalty(SOLID.RateDiscount):
+    rate = 0.95
+
+
+class Coupon(SOLID.Discount):
+    # not a RateDiscount: the pipeline has to call apply()
+    def apply(self, amount):
+        return amount - 1 if amount > 1 else amount
+
+
+def make_chain(n, rng):
+    kinds = [SOLID.SeasonalDiscount, Loyalty, SOLID.Discount, Coupon]
+    return [rng.choice(kinds)() for _ in range(n)]
+
+
+def per_item(amounts, chain):
+    out = []
+    for a in amounts:
+        for d in chain:
+            a = SOLID.checkout(a, d)
+        out.append(a)
+    return out
+
+
+def main(n=100_000):
+    rng = random.Random(0)
+    amounts = [rng.uniform(1, 500) for _ in range(n)]
+    money = [Decimal(f"{a:.2f}") for a in amounts]
+    row("chain", "checkout Mi/s", "pipeline Mi/s", "decimal Mi/s", "speedup", width=15)
+    for length in (1, 2, 5, 10, 20):
+        chain = make_chain(length, rng)
+        pipe = SOLID.pipeline(*chain)
+        assert list(pipe.apply(amounts)) == per_item(amounts, chain)
+        t_ref = best_of(lambda: per_item(amounts, chain), 1)
+        t_pipe = best_of(lambda: pipe.apply(amounts))
+        t_dec = best_of(lambda: pipe.apply_decimal(money), 1)
+        row(length, f"{n / t_ref / 1e6:.2f}", f"{n / t_pipe / 1e6:.2f}",
+            f"{n / t_dec / 1e6:.2f}", f"{t_ref / t_pipe:.1f}x", width=15)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
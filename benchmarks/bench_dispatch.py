@@ -0,0 +1,72 @@
+'''
+Per-object polymorphic calls vs poly.BatchDispatcher on mixed lists with
+1, 2, 8 and 64 distinct Animal types.
+
+speak(): a method that only returns a word. Nothing to batch, so the
+dispatcher should stay close to the plain loop, and a cheap hook cannot make
+up for the grouping.
+
+save(): one SQLite INSERT per object vs a save_batch() hook doing one
+executemany() per type - the kind of per-call cost hooks are for.
+
+    python benchmarks/bench_dispatch.py [objects]
+'''
+
+import random
+import sqlite3
+import sys
+
+from _common import best_of, row
+
+from oop_tutorial import poly
+
+DB = sqlite3.connect(":memory:")
+DB.execute("CREATE TABLE animals (kind TEXT, word TEXT)")
+INSERT = "INSERT INTO animals VALUES (?, ?)"
+
+
+def make_types(count, with_hook):
+    types = []
+    for i in range(count):
+        kind, word = f"Animal{i}", f"sound{i}"
+
+        def save(self, kind=kind, word=word):
+            DB.execute(INSERT, (kind, word))
+            return word
+
+        ns = {"speak": lambda self, word=word: word, "save": save}
+        if with_hook:
+            ns["speak_batch"] = classmethod(lambda cls, objs, word=word: [word] * len(objs))
+
+            def save_batch(cls, objs, kind=kind, word=word):
+                DB.executemany(INSERT, [(kind, word)] * len(objs))
+                return [word] * len(objs)
+
+            ns["save_batch"] = classmethod(save_batch)
+        types.append(type(kind, (poly.Animal,), ns))
+    return types
+
+
+def main(n=200_000):
+    rng = random.Random(0)
+    row("types", "method", "per-object ms", "dispatch ms", "hook ms", width=16)
+    for method in ("speak", "save"):
+        for count in (1, 2, 8, 64):
+            plain = make_types(count, False)
+            hooked = make_types(count, True)
+            picks = [rng.randrange(count) for _ in range(n)]
+            objs = [plain[i]() for i in picks]
+            hobjs = [hooked[i]() for i in picks]
+            dispatch = poly.BatchDispatcher(method)
+            loop = eval(f"lambda: [o.{method}() for o in objs]", {"objs": objs})
+            assert dispatch(objs) == loop() == dispatch(hobjs)
+            t_loop = best_of(loop)
+            t_disp = best_of(lambda: dispatch(objs))
+            t_hook = best_of(lambda: dispatch(hobjs))
+            row(count, method, f"{t_loop * 1e3:.1f}", f"{t_disp * 1e3:.1f}",
+                f"{t_hook * 1e3:.1f}", width=16)
+            DB.execute("DELETE FROM animals")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
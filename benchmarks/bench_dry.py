@@ -0,0 +1,47 @@
+'''
+Records/sec: DRY.save_user (open/write/close per call) vs the shared AppendWriter.
+
+    python benchmarks/bench_dry.py [records]
+'''
+
+import os
+import sys
+import tempfile
+
+from _common import best_of, row
+
+from oop_tutorial import DRY
+
+
+def main(n=20_000):
+    names = [f"user\n{i}" for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+
+        def per_call():
+            for name in names:
+                DRY.save_user(name)
+
+        def buffered(policy):
+            def run():
+                with DRY.AppendWriter(durability=policy) as w:
+                    for name in names:
+                        w.append("u.txt", name)
+            return run
+
+        row("variant", "records/sec")
+        row("save_user", f"{n / best_of(per_call):,.0f}")
+        for policy in (DRY.FSYNC_NEVER, DRY.FSYNC_BATCH):
+            row(f"writer/{policy}", f"{n / best_of(buffered(policy)):,.0f}")
+        # fsync per record is orders of magnitude slower: use a small sample
+        small = names[:500]
+        def per_record():
+            with DRY.AppendWriter(durability=DRY.FSYNC_RECORD) as w:
+                for name in small:
+                    w.append("u.txt", name)
+        row("writer/record", f"{len(small) / best_of(per_record):,.0f}")
+        os.chdir(os.path.dirname(tmp))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
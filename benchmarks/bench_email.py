@@ -0,0 +1,53 @@
+'''
+Bulk welcome mail throughput against a local SMTP stand-in (no network):
+one smtplib connection per message vs EmailService.send_welcome_many with
+pooled connections, for several pool sizes. The stand-in adds a fixed
+per-message delay like a real relay and can reject a fraction of messages
+with a temporary 451 so retries are exercised.
+
+    python benchmarks/bench_email.py [users] [delay_ms] [fail_rate]
+'''
+
+import asyncio
+import os
+import smtplib
+import sys
+import time
+
+from _common import ROOT, row
+
+from oop_tutorial import SOLID
+
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+from stand_in_smtp import StandInSMTP  # shared with tests/test_email.py
+
+
+def one_connection_each(server, users):
+    for user in users:
+        with smtplib.SMTP("127.0.0.1", server.port) as conn:
+            conn.send_message(SOLID.EmailService()._message(user))
+
+
+def main(n=500, delay_ms=5, fail_rate=0.02):
+    users = [SOLID.User(f"user{i}") for i in range(n)]
+    row("method", "msgs/s", "connections", "failed", width=16)
+
+    server = StandInSMTP(delay_ms / 1000)
+    start = time.perf_counter()
+    one_connection_each(server, users)
+    row("conn/message", f"{n / (time.perf_counter() - start):,.0f}", server.connections, 0, width=16)
+
+    for pool_size in (1, 4, 16, 32):
+        server = StandInSMTP(delay_ms / 1000, fail_rate)
+        service = SOLID.EmailService("127.0.0.1", server.port, pool_size=pool_size, backoff=0.01)
+        start = time.perf_counter()
+        results = asyncio.run(service.send_welcome_many(users))
+        elapsed = time.perf_counter() - start
+        service.close()
+        failed = sum(r is not None for r in results)
+        row(f"pool={pool_size}", f"{n / elapsed:,.0f}", server.connections, failed, width=16)
+
+
+if __name__ == "__main__":
+    n, *rest = sys.argv[1:] or ["500"]
+    main(int(n), *map(float, rest))
@@ -0,0 +1,53 @@
+'''
+external_sort / nsmallest on a generated stream of people several times
+larger than the in-memory budget, vs sorted() on a fully loaded list.
+
+    python benchmarks/bench_external_sort.py [people] [buffer_size]
+'''
+
+import random
+import sys
+import time
+import tracemalloc
+
+from _common import row
+
+from oop_tutorial import magic_methods as mm
+
+
+def generate(n):
+    rng = random.Random(0)
+    for i in range(n):
+        yield mm.Person(f"Name{i}", rng.randrange(1, 100))
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def drain(it):
+    for _ in it:
+        pass
+
+
+def main(n=1_000_000, buffer_size=100_000):
+    print(f"{n:,} people, budget {buffer_size:,} ({n // buffer_size}x smaller)")
+    row("method", "seconds", "peak MB", width=22)
+    for name, fn in [
+        ("sorted(list)", lambda: drain(sorted(list(generate(n))))),
+        ("external_sort", lambda: drain(mm.external_sort(generate(n), buffer_size))),
+        ("nsmallest(100)", lambda: mm.nsmallest(100, generate(n))),
+        ("nlargest(100)", lambda: mm.nlargest(100, generate(n))),
+    ]:
+        elapsed, peak = measure(fn)
+        row(name, f"{elapsed:.2f}", f"{peak:.1f}", width=22)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
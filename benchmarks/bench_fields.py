@@ -0,0 +1,52 @@
+'''
+Attribute get / set and construction, in ns per operation: plain attributes
+vs the hand-written property setters (magic_methods.Person.name,
+encaps.Dog.set_age) vs encaps.validated Field classes, with validation on
+and inside trusted().
+
+    python benchmarks/bench_fields.py [iterations]
+'''
+
+import sys
+import timeit
+
+from _common import row
+
+from oop_tutorial import magic_methods as mm
+from oop_tutorial import encaps as en
+
+
+class Plain:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+# statement per column: plain, property-based, Field, Field in trusted()
+CASES = {
+    "construct": ("Plain('Rex', 3)", "Person('Rex', 3)", "Pet('Rex', 3)", "Pet('Rex', 3)"),
+    "get name": ("p.name", "person.name", "pet.name", "pet.name"),
+    "set name": ("p.name = 'Max'", "person.name = 'Max'", "pet.name = 'Max'", "pet.name = 'Max'"),
+    "get age": ("p.age", "dog.get_age()", "pet.age", "pet.age"),
+    "set age": ("p.age = 4", "dog.set_age(4)", "pet.age = 4", "pet.age = 4"),
+}
+
+
+def ns_per_op(stmt, env, n):
+    return min(timeit.repeat(stmt, globals=env, number=n, repeat=5)) / n * 1e9
+
+
+def main(n=500_000):
+    env = {"Plain": Plain, "Person": mm.Person, "Pet": en.Pet,
+           "p": Plain("Rex", 3), "person": mm.Person("Rex", 3),
+           "dog": en.Dog("Rex", "Labrador", 3), "pet": en.Pet("Rex", 3)}
+    row("op", "plain", "property", "Field", "Field trusted")
+    for op, (plain, prop, field, field_trusted) in CASES.items():
+        cols = [ns_per_op(plain, env, n), ns_per_op(prop, env, n), ns_per_op(field, env, n)]
+        with en.trusted():
+            cols.append(ns_per_op(field_trusted, env, n))
+        row(op, *(f"{c:.0f}" for c in cols))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
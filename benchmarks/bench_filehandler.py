@@ -0,0 +1,89 @@
+'''
+SOLID.FileHandler vs naive open().read(): read throughput (every byte is
+checksummed so nothing is skipped) and writev() vs one write() per buffer.
+
+    python benchmarks/bench_filehandler.py [size_mb ...]    # default 1 16 256
+
+Several-GB sizes work too (pass e.g. 4096); make sure /tmp has room.
+'''
+
+import os
+import sys
+import tempfile
+import zlib
+
+from _common import best_of, row
+
+from oop_tutorial import SOLID
+
+
+def make_file(path, size):
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        for _ in range(size >> 20):
+            f.write(block)
+
+
+def naive(path):
+    with open(path, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def mapped(path):
+    with SOLID.FileHandler(path) as h:
+        return zlib.crc32(h.read())
+
+
+def chunked(path):
+    crc = 0
+    with SOLID.FileHandler(path) as h:
+        for chunk in h.chunks(1 << 20):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def reused_buffer(path):
+    crc, offset = 0, 0
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    h = SOLID.FileHandler(path)
+    while True:
+        n = h.readinto(buf, offset)
+        if not n:
+            return crc
+        crc = zlib.crc32(view[:n], crc)
+        offset += n
+
+
+def main(*sizes_mb):
+    sizes_mb = sizes_mb or (1, 16, 256)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.bin")
+        row("size MB", "open().read", "mmap read()", "chunks()", "readinto", width=14)
+        for mb in sizes_mb:
+            make_file(path, mb << 20)
+            assert naive(path) == mapped(path) == chunked(path) == reused_buffer(path)
+            repeat = 3 if mb <= 256 else 1
+            rates = [f"{mb / best_of(lambda: fn(path), repeat):,.0f} MB/s"
+                     for fn in (naive, mapped, chunked, reused_buffer)]
+            row(mb, *rates, width=14)
+
+        # writing 100k small records: one write() each vs writev()
+        records = [b"record %d\n" % i for i in range(100_000)]
+        out = os.path.join(tmp, "out.bin")
+
+        def one_by_one():
+            with open(out, "wb", buffering=0) as f:
+                for r in records:
+                    f.write(r)
+
+        def vectored():
+            os.remove(out)
+            SOLID.FileHandler(out).writev(records)
+
+        print(f"100k records: write() each {best_of(one_by_one, 1):.3f}s, "
+              f"writev {best_of(vectored, 1):.3f}s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,65 @@
+'''
+Startup cost of the oop_tutorial package and of each lesson module, measured
+with `python -X importtime` in a fresh interpreter (best of `repeat` runs).
+Fails (exit status 1) when an import prints anything or goes over its
+budget, so a heavy module imported at the top of a lesson shows up here.
+
+    python benchmarks/bench_import.py [repeat]
+'''
+
+import os
+import subprocess
+import sys
+
+from _common import ROOT, row
+
+PACKAGE = "oop_tutorial"
+
+# Cumulative import time budgets in milliseconds, roughly 2x what they cost
+# now. They include stdlib modules a lesson really needs (re, enum,
+# dataclasses, ...). asyncio, concurrent.futures, multiprocessing, smtplib
+# and email are each worth 15-40 ms and must stay out of module level.
+BUDGET_MS = {
+    PACKAGE: 5,
+    "DRY": 15, "KISS": 15, "SOLID": 35, "YAGNI": 35,
+    "abs": 10, "abstractBaseClasses": 10,
+    "classes": 10, "magic_methods": 30,
+    "encaps": 15,
+    "composition": 10, "inheritence": 10, "inheritence_type": 10,
+    "poly": 15, "pspec": 40,
+}
+
+
+def import_ms(module):
+    """(cumulative import time in ms, stdout) of `import module` in a new process."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    for line in proc.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000, proc.stdout
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def main(repeat=5):
+    failed = False
+    row("module", "ms", "budget ms", "", width=22)
+    for name, budget in BUDGET_MS.items():
+        module = name if name == PACKAGE else f"{PACKAGE}.{name}"
+        runs = [import_ms(module) for _ in range(repeat)]
+        best = min(ms for ms, _ in runs)
+        output = runs[0][1]
+        status = "ok"
+        if output:
+            status = f"prints {output.splitlines()[0]!r}"
+        elif best > budget:
+            status = "OVER BUDGET"
+        failed = failed or status != "ok"
+        row(name, f"{best:.1f}", budget, status, width=22)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
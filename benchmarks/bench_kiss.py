@@ -0,0 +1,43 @@
+'''
+KISS.squares (list) vs KISS.squares_typed on array.array and NumPy inputs.
+
+    python benchmarks/bench_kiss.py
+'''
+
+import sys
+from array import array
+
+from _common import best_of, row
+
+from oop_tutorial import KISS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def main(sizes=(10**3, 10**4, 10**5, 10**6, 10**7)):
+    row("size", "list s", "array(d) s", "array(i) s", "numpy s", "list MB", "array MB")
+    for n in sizes:
+        nums = list(range(n))
+        floats = array("d", nums)
+        ints = array("i", nums)
+        repeat = 3 if n < 10**7 else 1
+        t_list = best_of(lambda: KISS.squares(nums), repeat)
+        t_d = best_of(lambda: KISS.squares_typed(floats), repeat)
+        t_i = best_of(lambda: KISS.squares_typed(ints), repeat)
+        t_np = "n/a"
+        if numpy is not None:
+            arr = numpy.arange(n, dtype=numpy.float64)
+            t_np = f"{best_of(lambda: KISS.squares_typed(arr), repeat):.5f}"
+        # result memory: list of boxed ints vs one flat buffer
+        out = KISS.squares(nums)
+        list_mb = (sys.getsizeof(out) + sum(map(sys.getsizeof, out))) / 1e6
+        array_mb = n * floats.itemsize / 1e6
+        row(n, f"{t_list:.5f}", f"{t_d:.5f}", f"{t_i:.5f}", t_np,
+            f"{list_mb:.1f}", f"{array_mb:.1f}")
+
+
+if __name__ == "__main__":
+    main()
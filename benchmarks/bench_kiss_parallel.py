@@ -0,0 +1,42 @@
+'''
+Scaling of KISS.squares_parallel from 1 to N worker processes, plus the
+streaming generator's throughput on a packed binary file.
+
+    python benchmarks/bench_kiss_parallel.py [size] [max_workers]
+'''
+
+import os
+import sys
+import tempfile
+from array import array
+
+from _common import best_of, row
+
+from oop_tutorial import KISS
+
+
+def main(size=10**7, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    nums = array("d", range(size))
+    base = best_of(lambda: KISS.squares_typed(nums), 1)
+    row("workers", "seconds", "Melem/s", "speedup")
+    row("serial", f"{base:.3f}", f"{size / base / 1e6:.1f}", "1.00")
+    workers = 1
+    while workers <= max(max_workers, 4):
+        t = best_of(lambda: KISS.squares_parallel(nums, workers), 1)
+        row(workers, f"{t:.3f}", f"{size / t / 1e6:.1f}", f"{base / t:.2f}")
+        workers *= 2
+    print(f"(os.cpu_count() = {os.cpu_count()}; counts above it only add overhead)")
+
+    with tempfile.TemporaryFile() as f:
+        nums.tofile(f)
+        def stream():
+            f.seek(0)
+            for _ in KISS.squares_file(f, "d"):
+                pass
+        t = best_of(stream, 1)
+        print(f"squares_file streaming: {size / t / 1e6:.1f} Melem/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+'''
+pspec.LinkedList vs list, collections.deque and the same linked list built
+from a non-slotted node class: memory per element and queue ops/sec.
+
+    python benchmarks/bench_linked_list.py [elements]
+'''
+
+import sys
+import tracemalloc
+from collections import deque
+
+from _common import best_of, row
+
+from oop_tutorial import pspec
+
+
+class PlainNode:
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
+
+
+class PlainLinkedList(pspec.LinkedList):
+    node_type = PlainNode
+
+
+def bytes_per_element(factory, n):
+    tracemalloc.start()
+    obj = factory(range(n))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return size / n
+
+
+def churn(q, pop, n):
+    # steady-state queue: push one, pop one
+    def run():
+        for i in range(n):
+            q.append(i)
+            pop()
+    return run
+
+
+def main(n=200_000):
+    row("container", "bytes/elem", "append+pop Mops/s", "extend Melem/s", width=20)
+    for name, factory, popper in [
+        ("list", list, lambda q: q.pop),
+        ("deque", deque, lambda q: q.popleft),
+        ("LinkedList", pspec.LinkedList, lambda q: q.popleft),
+        ("LinkedList(plain)", PlainLinkedList, lambda q: q.popleft),
+    ]:
+        per_elem = bytes_per_element(factory, n)
+        q = factory(range(1000))
+        t_churn = best_of(churn(q, popper(q), n))
+        t_extend = best_of(lambda: factory().extend(range(n)))
+        row(name, f"{per_elem:.1f}", f"{2 * n / t_churn / 1e6:.2f}",
+            f"{n / t_extend / 1e6:.2f}", width=20)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,72 @@
+'''
+Latency that log() adds to the caller: ConsoleLogger (print) vs AsyncLogger,
+both writing to the same kind of sink (a file, or a pipe nobody reads fast).
+
+    python benchmarks/bench_logger.py [messages]
+'''
+
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from _common import row
+
+from oop_tutorial import SOLID
+
+
+def latencies(logger, n):
+    out = []
+    clock = time.perf_counter_ns
+    for i in range(n):
+        start = clock()
+        logger.log(f"request {i} handled")
+        out.append(clock() - start)
+    out.sort()
+    return out
+
+
+def report(name, lat):
+    pick = lambda q: lat[min(len(lat) - 1, int(q * len(lat)))] / 1000
+    row(name, f"{pick(0.5):.2f}", f"{pick(0.99):.2f}", f"{lat[-1] / 1000:.0f}", width=32)
+
+
+class SlowPipe:
+    """A reader that drains 64 KiB at a time every 2 ms, like a busy terminal."""
+    def __init__(self):
+        self.r, self.w = os.pipe()
+        self.stream = os.fdopen(self.w, "w")
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        while os.read(self.r, 65536):
+            time.sleep(0.002)
+
+
+def main(n=100_000):
+    row("logger", "p50 us", "p99 us", "max us", width=32)
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "console.log"), "w") as f, contextlib.redirect_stdout(f):
+            console = latencies(SOLID.ConsoleLogger(), n)
+        report("ConsoleLogger -> file", console)
+        logger = SOLID.AsyncLogger(path=os.path.join(tmp, "async.log"))
+        report("AsyncLogger -> file", latencies(logger, n))
+        logger.close()
+
+        pipe = SlowPipe()
+        with contextlib.redirect_stdout(pipe.stream):
+            console = latencies(SOLID.ConsoleLogger(), n)
+        report("ConsoleLogger -> pipe", console)
+        for policy in (SOLID.BLOCK, SOLID.DROP_NEWEST):
+            logger = SOLID.AsyncLogger(overflow=policy, stream=SlowPipe().stream)
+            lat = latencies(logger, n)
+            logger.close()
+            report(f"AsyncLogger/{policy} -> pipe", lat)
+            if logger.dropped:
+                print(f"  dropped {logger.dropped:,} messages")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,51 @@
+'''
+Rows/sec loading a `name,age` CSV: per-row Person(...) vs the bulk
+Person.from_csv with 1, 2, 4 and 8 worker processes, as objects and as a
+PersonTable.
+
+    python benchmarks/bench_person_csv.py [rows]
+'''
+
+import csv
+import os
+import random
+import sys
+import tempfile
+
+from _common import best_of, row
+
+from oop_tutorial import magic_methods as mm
+
+
+def per_row(path):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [mm.Person(name, int(age)) for name, age in reader]
+
+
+def main(n=1_000_000):
+    rng = random.Random(0)
+    pool = [f"Name{i}" for i in range(10_000)]
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="", delete=False) as f:
+        writer = csv.writer(f)
+        writer.writerow(("name", "age"))
+        writer.writerows((rng.choice(pool), rng.randrange(1, 100)) for _ in range(n))
+        path = f.name
+    try:
+        assert mm.Person.from_csv(path, workers=2)[:100] == per_row(path)[:100]
+        row("loader", "workers", "seconds", "rows/s", width=16)
+        t = best_of(lambda: per_row(path), 1)
+        row("Person(...)", "-", f"{t:.3f}", f"{n / t:,.0f}", width=16)
+        for columnar in (False, True):
+            label = "from_csv table" if columnar else "from_csv"
+            for workers in (1, 2, 4, 8):
+                t = best_of(lambda: mm.Person.from_csv(path, workers, columnar), 1)
+                row(label, workers, f"{t:.3f}", f"{n / t:,.0f}", width=16)
+        print(f"(os.cpu_count() = {os.cpu_count()}; counts above it only add overhead)")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
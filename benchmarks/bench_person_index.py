@@ -0,0 +1,37 @@
+'''
+PersonIndex point lookups and age-range queries vs scanning a list.
+
+    python benchmarks/bench_person_index.py [people] [queries]
+'''
+
+import random
+import sys
+
+from _common import best_of, row
+
+from oop_tutorial import magic_methods as mm
+
+
+def main(n=100_000, queries=200):
+    rng = random.Random(0)
+    people = [mm.Person(f"Name{rng.randrange(n)}", rng.randrange(1, 100)) for _ in range(n)]
+    index = mm.PersonIndex(people)
+    probes = [(p.name, p.age) for p in rng.sample(people, queries)]
+    ranges = [(lo, lo + 5) for lo in (rng.randrange(1, 95) for _ in range(queries))]
+
+    scan_point = best_of(lambda: [[p for p in people if (p.name, p.age) == k] for k in probes], 1)
+    index_point = best_of(lambda: [index.find(*k) for k in probes])
+    scan_range = best_of(lambda: [[p for p in people if lo <= p.age <= hi] for lo, hi in ranges], 1)
+    index_range = best_of(lambda: [index.between(lo, hi) for lo, hi in ranges])
+    renames = best_of(lambda: [setattr(p, "name", p.name + "x") for p in people[:1000]], 1)
+
+    row("query", "list scan us", "index us", "speedup", width=16)
+    row("point", f"{scan_point / queries * 1e6:.1f}", f"{index_point / queries * 1e6:.2f}",
+        f"{scan_point / index_point:.0f}x", width=16)
+    row("range(6 ages)", f"{scan_range / queries * 1e6:.1f}", f"{index_range / queries * 1e6:.1f}",
+        f"{scan_range / index_range:.0f}x", width=16)
+    print(f"indexed rename via setter: {renames / 1000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,53 @@
+'''
+Bytes per record and sort time: list of Person objects vs PersonTable.
+
+    python benchmarks/bench_person_table.py [records]
+'''
+
+import random
+import sys
+import time
+import tracemalloc
+
+from _common import row
+
+from oop_tutorial import magic_methods as mm
+
+
+def traced(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def main(n=1_000_000):
+    rng = random.Random(0)
+    pool = [f"Name{i}" for i in range(10_000)]  # realistic: names repeat
+    records = [(rng.choice(pool), rng.randrange(1, 100)) for _ in range(n)]
+
+    people, people_bytes = traced(lambda: [mm.Person(name, age) for name, age in records])
+    table, table_bytes = traced(lambda: _build_table(records))
+
+    start = time.perf_counter()
+    sorted(people)
+    t_objects = time.perf_counter() - start
+    start = time.perf_counter()
+    table.argsort()
+    t_table = time.perf_counter() - start
+
+    row("store", "bytes/record", "sort s", width=16)
+    row("list[Person]", f"{people_bytes / n:.1f}", f"{t_objects:.3f}", width=16)
+    row("PersonTable", f"{table_bytes / n:.1f}", f"{t_table:.3f}", width=16)
+
+
+def _build_table(records):
+    table = mm.PersonTable()
+    for name, age in records:
+        table.append(name, age)
+    return table
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
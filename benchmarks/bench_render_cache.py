@@ -0,0 +1,78 @@
+'''
+RenderCache under a hot-key workload: requests pick one of `keys` reports
+with a Zipf(s) distribution. Compares rendering every time with the cache
+(memory tier only, and memory + disk tiers), and shows single flight when
+many threads ask for the same cold report at once.
+
+    python benchmarks/bench_render_cache.py [requests] [keys] [s]
+'''
+
+import bisect
+import itertools
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from _common import row
+
+from oop_tutorial import YAGNI
+
+
+def zipf_sampler(keys, s, rng):
+    cumulative = list(itertools.accumulate(1 / (k + 1) ** s for k in range(keys)))
+    total = cumulative[-1]
+    return lambda: bisect.bisect(cumulative, rng.random() * total)
+
+
+def make_reports(keys, rows=2000):
+    return [YAGNI.Report(f"Report {k}", [(k, i, f"item {i}", i * 0.5) for i in range(rows)],
+                         ("report", "row", "name", "value")) for k in range(keys)]
+
+
+def main(requests=3000, keys=300, s=1.1):
+    rng = random.Random(0)
+    reports = make_reports(int(keys))
+    pick = zipf_sampler(int(keys), float(s), rng)
+    workload = [reports[pick()] for _ in range(int(requests))]
+    size = len(b"".join(reports[0].generate_html()))
+    budget = size * int(keys) // 10  # memory tier holds ~10% of the reports
+
+    row("mode", "req/s", "hits", "disk hits", "misses", "evictions", width=12)
+    start = time.perf_counter()
+    for r in workload:
+        b"".join(r.generate_html())
+    row("no cache", f"{len(workload) / (time.perf_counter() - start):,.0f}", "-", "-", "-", "-", width=12)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cache in (("memory", YAGNI.RenderCache(budget)),
+                            ("memory+disk", YAGNI.RenderCache(budget, directory=tmp))):
+            start = time.perf_counter()
+            for r in workload:
+                cache.get(r)
+            rate = len(workload) / (time.perf_counter() - start)
+            st = cache.stats()
+            row(name, f"{rate:,.0f}", st["hits"], st["disk_hits"], st["misses"], st["evictions"], width=12)
+
+    # single flight: 32 threads, one cold key
+    cache = YAGNI.RenderCache()
+    renders = [0]
+
+    class Counted(YAGNI.Report):
+        def generate_html(self, chunk_size=None):
+            renders[0] += 1
+            return super().generate_html(chunk_size)
+
+    cold = Counted("cold", reports[0].rows, reports[0].columns)
+    threads = [threading.Thread(target=cache.get, args=(cold,)) for _ in range(32)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"single flight: 32 concurrent requests -> {renders[0]} render(s), "
+          f"{cache.coalesced} coalesced")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,67 @@
+'''
+Streaming Report.generate_html vs building the whole document as one string:
+time to first byte, total time and peak memory (tracemalloc).
+
+    python benchmarks/bench_report.py [rows]
+'''
+
+import os
+import sys
+import time
+import tracemalloc
+from html import escape
+
+from _common import row
+
+from oop_tutorial import YAGNI
+
+
+def rows(n):
+    for i in range(n):
+        yield (i, f"customer <{i}>", i * 3.5, "paid" if i % 3 else "open & late")
+
+
+def one_big_string(report):
+    # what a non-streaming generate_html would have to do
+    out = [f"<!DOCTYPE html>\n<html><head><title>{escape(report.title)}</title></head>\n<body><table>\n"]
+    for r in report.rows:
+        out.append("<tr>" + "".join(f"<td>{escape(str(c))}</td>" for c in r) + "</tr>\n")
+    out.append("</table></body></html>\n")
+    yield "".join(out).encode()
+
+
+def measure(make_chunks, sink):
+    # timings without tracemalloc (it slows every allocation), then a second
+    # traced run for the memory peak
+    start = time.perf_counter()
+    first = None
+    total = 0
+    for chunk in make_chunks():
+        if first is None:
+            first = time.perf_counter() - start
+        sink.write(chunk)
+        total += len(chunk)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    for chunk in make_chunks():
+        sink.write(chunk)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return first, elapsed, peak, total
+
+
+def main(n=500_000):
+    row("method", "first byte ms", "total s", "peak MB", "output MB", width=16)
+    with open(os.devnull, "wb") as sink:
+        for name, make in [
+            ("one string", lambda: one_big_string(YAGNI.Report("Sales", rows(n)))),
+            ("stream 64K", lambda: YAGNI.Report("Sales", rows(n)).generate_html()),
+            ("stream 1M", lambda: YAGNI.Report("Sales", rows(n)).generate_html(1 << 20)),
+        ]:
+            first, elapsed, peak, total = measure(make, sink)
+            row(name, f"{first * 1e3:.1f}", f"{elapsed:.2f}", f"{peak / 1e6:.1f}",
+                f"{total / 1e6:.1f}", width=16)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,66 @@
+'''
+KDTree and UniformGrid vs brute-force scans: build time and query latency
+for nearest-neighbour, 10-nearest and small rectangle queries.
+
+    python benchmarks/bench_spatial.py [max_exponent]   # 10^4 .. 10^max (default 6)
+
+10^7 points works but the pure-Python build takes minutes.
+'''
+
+import random
+import sys
+import time
+
+from _common import best_of, row
+
+from oop_tutorial import pspec
+
+
+def brute_nearest(pa, x, y, k):
+    xs, ys = pa.xs, pa.ys
+    d = [(px - x) ** 2 + (py - y) ** 2 for px, py in zip(xs, ys)]
+    return sorted(range(len(d)), key=d.__getitem__)[:k]
+
+
+def brute_within(pa, xmin, ymin, xmax, ymax):
+    return [i for i, (px, py) in enumerate(zip(pa.xs, pa.ys))
+            if xmin <= px <= xmax and ymin <= py <= ymax]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main(max_exponent=6):
+    rng = random.Random(0)
+    row("points", "index", "build s", "nn us", "10nn us", "rect us", width=12)
+    for e in range(4, max_exponent + 1):
+        n = 10 ** e
+        side = 1000.0
+        pa = pspec.PointArray(pspec.FastPoint(rng.uniform(0, side), rng.uniform(0, side))
+                              for _ in range(n))
+        queries = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(100)]
+        w = side / 100  # rectangle holding ~n/10^4 points
+        tree, t_tree = timed(lambda: pspec.KDTree(pa))
+        # ~2 points per cell
+        grid, t_grid = timed(lambda: pspec.UniformGrid(side / (n / 2) ** 0.5, pa))
+
+        def per_query(fn, count=len(queries)):
+            return best_of(lambda: [fn(x, y) for x, y in queries[:count]], 1) / count * 1e6
+
+        for name, idx, t_build in (("kdtree", tree, t_tree), ("grid", grid, t_grid)):
+            row(n, name, f"{t_build:.2f}",
+                f"{per_query(idx.nearest):.1f}",
+                f"{per_query(lambda x, y: idx.k_nearest(x, y, 10)):.1f}",
+                f"{per_query(lambda x, y: idx.within(x, y, x + w, y + w)):.1f}", width=12)
+        few = 3 if n >= 10**6 else 10  # brute force is slow: fewer queries
+        row(n, "brute", "-",
+            f"{per_query(lambda x, y: brute_nearest(pa, x, y, 1), few):.0f}",
+            f"{per_query(lambda x, y: brute_nearest(pa, x, y, 10), few):.0f}",
+            f"{per_query(lambda x, y: brute_within(pa, x, y, x + w, y + w), few):.0f}", width=12)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
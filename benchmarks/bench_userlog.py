@@ -0,0 +1,71 @@
+'''
+Multi-writer throughput for SOLID.UserRepository on one local users.txt.
+
+Each writer process runs `threads` threads calling save() with fsync=True;
+with group commit, saves from every thread and process that queue up while
+one batch is being written share the next locked write + fsync. On tmpfs
+or a drive with a write cache fsync is nearly free and there is little to
+win; `fsync_ms` adds a fixed delay to every fsync to stand in for a disk
+that really waits.
+
+    python benchmarks/bench_userlog.py [saves_per_thread] [threads] [fsync_ms]
+'''
+
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from _common import row
+
+
+def writer(path, worker, saves, threads, group_commit, fsync_ms):
+    from oop_tutorial import SOLID
+    if fsync_ms:
+        fsync = os.fsync
+        os.fsync = lambda fd: (time.sleep(fsync_ms / 1000), fsync(fd))
+    repo = SOLID.UserRepository(path, group_commit=group_commit, fsync=True)
+
+    def run(t):
+        for i in range(saves):
+            repo.save(SOLID.User(f"w{worker}-t{t}-{i}"))
+
+    pool = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    repo.close()
+
+
+def measure(procs, saves, threads, group_commit, fsync_ms):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "users.txt")
+        start = time.perf_counter()
+        workers = [mp.Process(target=writer, args=(path, w, saves, threads, group_commit, fsync_ms))
+                   for w in range(procs)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        elapsed = time.perf_counter() - start
+        with open(path, "rb") as f:
+            assert sum(1 for _ in f) == procs * saves * threads
+        with open(path + ".idx", "rb") as f:
+            assert sum(1 for _ in f) == procs * saves * threads
+    return procs * saves * threads / elapsed
+
+
+def main(saves=200, threads=4, fsync_ms=0.0):
+    row("processes", "threads", "plain rec/s", "group rec/s")
+    for per_proc in sorted({1, threads}):
+        for procs in (1, 2, 4, 8):
+            row(procs, per_proc,
+                f"{measure(procs, saves, per_proc, False, fsync_ms):,.0f}",
+                f"{measure(procs, saves, per_proc, True, fsync_ms):,.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]), *map(float, sys.argv[3:]))
@@ -0,0 +1,53 @@
+'''
+Eager Vector chains vs lazy fused evaluation (poly.lazy).
+
+For chains of increasing length, reports time per evaluation and the
+tracemalloc peak (bytes of live temporaries over a loop of evaluations) for:
+    eager    v0 + v1 + ... + vn
+    lazy     (lazy(v0) + v1 + ... + vn).eval()    tree rebuilt every time
+    reused   expr.eval(out=v) on a tree built once (the simulation-loop case)
+
+    python benchmarks/bench_vector_lazy.py
+'''
+
+import functools
+import operator
+import timeit
+import tracemalloc
+
+from _common import row
+
+from oop_tutorial import poly
+
+
+def peak_bytes(fn, loops=200):
+    fn()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    for _ in range(loops):
+        fn()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return peak
+
+
+def main(lengths=(2, 4, 8, 16, 64, 256)):
+    row("chain", "eager us", "lazy us", "reused us", "eager peak B", "lazy peak B", "reused peak B")
+    for n in lengths:
+        vs = [poly.Vector(i, i) for i in range(n)]
+        expr = functools.reduce(operator.add, vs[1:], poly.lazy(vs[0]))
+        out = poly.Vector(0, 0)
+
+        eager = lambda: functools.reduce(operator.add, vs)
+        lazy = lambda: functools.reduce(operator.add, vs[1:], poly.lazy(vs[0])).eval()
+        reused = lambda: expr.eval(out)
+
+        times = [min(timeit.repeat(f, number=2000, repeat=3)) / 2000 * 1e6
+                 for f in (eager, lazy, reused)]
+        peaks = [peak_bytes(f) for f in (eager, lazy, reused)]
+        row(n, *(f"{t:.2f}" for t in times), *peaks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+'''
+The tutorial as one importable package.
+
+The lesson folders have spaces in their names, so they cannot be packages
+themselves. Instead this package's __path__ lists them and every lesson file
+is a submodule:
+
+    from oop_tutorial import SOLID, magic_methods
+    import oop_tutorial.pspec
+
+Importing the package loads nothing else; a lesson is imported the first
+time it is used (PEP 562 module __getattr__). Lessons only run their demos
+when executed directly, e.g. `python -m oop_tutorial.SOLID`.
+'''
+
+import importlib
+import os
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LESSONS = {
+    "Design Principles": ("DRY", "KISS", "SOLID", "YAGNI"),
+    os.path.join("OOP concepts", "Abstraction"): ("abs", "abstractBaseClasses"),
+    os.path.join("OOP concepts", "Classes, objects and methods"): ("classes", "magic_methods"),
+    os.path.join("OOP concepts", "Encapsulation"): ("encaps",),
+    os.path.join("OOP concepts", "Inheritance"): ("composition", "inheritence", "inheritence_type"),
+    os.path.join("OOP concepts", "Polymorphism"): ("poly",),
+    os.path.join("OOP concepts", "python Specific"): ("pspec",),
+}
+
+__path__ = [os.path.dirname(os.path.abspath(__file__))]
+__path__ += [os.path.join(_ROOT, folder) for folder in _LESSONS]
+
+__all__ = [name for names in _LESSONS.values() for name in names]
+
+
+def __getattr__(name):
+    if name in __all__:
+        # import_module also sets the attribute, so this runs once per lesson
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
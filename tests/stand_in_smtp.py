@@ -0,0 +1,86 @@
+'''
+A local SMTP stand-in for the EmailService tests and benchmark (no network).
+'''
+
+import asyncio
+import random
+import threading
+from collections import Counter
+
+
+class StandInSMTP:
+    """Just enough of RFC 5321 for smtplib.send_message().
+
+    Each message is answered after `delay` seconds with the reply line
+    reply(recipient, attempt) returns, or 250 when it returns None; by
+    default a random `fail_rate` of messages get a temporary 451.
+    Recipients in `refused` are rejected at RCPT with their reply line, and
+    a 421 reply also closes the connection. `delivered` lists accepted
+    recipients in arrival order, `attempts` counts messages per recipient
+    and `refusals` counts RCPT rejections per recipient.
+    """
+
+    def __init__(self, delay=0.005, fail_rate=0.0, reply=None, refused=None):
+        self.delay, self.fail_rate = delay, fail_rate
+        self.reply = reply or self._random_failure
+        self.refused = refused or {}
+        self.delivered = []
+        self.attempts = Counter()
+        self.refusals = Counter()
+        self.connections = 0
+        self._rng = random.Random(0)
+        ready = threading.Event()
+        threading.Thread(target=self._serve, args=(ready,), daemon=True).start()
+        ready.wait()
+
+    @property
+    def accepted(self):
+        return len(self.delivered)
+
+    def _random_failure(self, recipient, attempt):
+        return b"451 try again later" if self._rng.random() < self.fail_rate else None
+
+    def _serve(self, ready):
+        async def main():
+            server = await asyncio.start_server(self._session, "127.0.0.1", 0)
+            self.port = server.sockets[0].getsockname()[1]
+            ready.set()
+            await server.serve_forever()
+        asyncio.run(main())
+
+    async def _session(self, reader, writer):
+        self.connections += 1
+        writer.write(b"220 stand-in ESMTP\r\n")
+        recipient = None
+        while line := await reader.readline():
+            verb = line[:4].upper()
+            if verb == b"EHLO":
+                writer.write(b"250-stand-in\r\n250 8BITMIME\r\n")
+            elif verb == b"RCPT":
+                recipient = line.split(b":", 1)[1].strip(b" <>\r\n").decode()
+                if recipient in self.refused:
+                    self.refusals[recipient] += 1
+                writer.write(self.refused.get(recipient, b"250 ok") + b"\r\n")
+            elif verb == b"DATA":
+                writer.write(b"354 go ahead\r\n")
+                await writer.drain()
+                while await reader.readline() != b".\r\n":
+                    pass
+                await asyncio.sleep(self.delay)
+                self.attempts[recipient] += 1
+                reply = self.reply(recipient, self.attempts[recipient])
+                if reply is None:
+                    self.delivered.append(recipient)
+                    reply = b"250 queued"
+                writer.write(reply + b"\r\n")
+                if reply.startswith(b"421"):
+                    await writer.drain()
+                    break
+            elif verb == b"QUIT":
+                writer.write(b"221 bye\r\n")
+                await writer.drain()
+                break
+            else:  # HELO, MAIL, RSET, NOOP
+                writer.write(b"250 ok\r\n")
+            await writer.drain()
+        writer.close()
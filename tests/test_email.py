@@ -0,0 +1,107 @@
+'''
+EmailService / SMTPPool against the local SMTP stand-in.
+
+    python -m pytest tests
+'''
+
+import asyncio
+import os
+import smtplib
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from oop_tutorial import SOLID
+from stand_in_smtp import StandInSMTP
+
+
+def users(n):
+    return [SOLID.User(f"user{i}") for i in range(n)]
+
+
+def send_all(server, people, **options):
+    options.setdefault("backoff", 0.001)
+    service = SOLID.EmailService("127.0.0.1", server.port, **options)
+    try:
+        return asyncio.run(service.send_welcome_many(people))
+    finally:
+        service.close()
+
+
+def test_connections_are_pooled():
+    server = StandInSMTP(delay=0.001)
+    results = send_all(server, users(40), pool_size=3)
+    assert results == [None] * 40
+    assert server.connections <= 3
+    assert sorted(server.delivered) == sorted(f"user{i}@example.com" for i in range(40))
+
+
+def test_results_and_delivery_keep_input_order():
+    bad = {"user3@example.com", "user7@example.com"}
+    server = StandInSMTP(delay=0, refused={a: b"550 no such user" for a in bad})
+    people = users(10)
+    results = send_all(server, people, pool_size=1)
+    for user, result in zip(people, results):
+        if f"{user.name}@example.com" in bad:
+            assert isinstance(result, smtplib.SMTPRecipientsRefused)
+        else:
+            assert result is None
+    # one connection works through the batch in order
+    assert server.delivered == [f"{u.name}@example.com" for u in people
+                                if f"{u.name}@example.com" not in bad]
+
+
+def test_transient_failure_is_retried_on_the_same_connection():
+    server = StandInSMTP(delay=0, reply=lambda rcpt, attempt:
+                         b"451 try again later" if attempt == 1 else None)
+    results = send_all(server, users(5), pool_size=1, retries=1)
+    assert results == [None] * 5
+    assert all(n == 2 for n in server.attempts.values())
+    assert server.connections == 1
+
+
+def test_permanent_failure_is_not_retried():
+    server = StandInSMTP(delay=0, reply=lambda rcpt, attempt:
+                         b"550 rejected" if rcpt == "user1@example.com" else None)
+    results = send_all(server, users(3), retries=3)
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], smtplib.SMTPDataError)
+    assert results[1].smtp_code == 550
+    assert server.attempts["user1@example.com"] == 1
+
+
+def test_refused_recipient_is_not_retried_unless_temporary():
+    server = StandInSMTP(delay=0, refused={"user0@example.com": b"550 no such user",
+                                          "user1@example.com": b"450 mailbox busy"})
+    results = send_all(server, users(2), retries=2)
+    assert all(isinstance(r, smtplib.SMTPRecipientsRefused) for r in results)
+    assert server.refusals == {"user0@example.com": 1, "user1@example.com": 3}
+
+
+def test_dropped_connection_is_discarded_and_retried():
+    server = StandInSMTP(delay=0, reply=lambda rcpt, attempt:
+                         b"421 closing" if attempt == 1 else None)
+    results = send_all(server, users(3), pool_size=1, retries=1)
+    assert results == [None] * 3
+    assert server.connections == 4  # first one per user is closed by the 421
+
+
+def test_pool_keeps_connection_after_a_reply_error_only():
+    server = StandInSMTP(delay=0, reply=lambda rcpt, attempt: b"451 later")
+    pool = SOLID.SMTPPool("127.0.0.1", server.port, size=1)
+    service = SOLID.EmailService(sender="a@example.com")
+    service.pool = pool
+    for _ in range(3):
+        with pytest.raises(smtplib.SMTPDataError):
+            service.send_welcome(SOLID.User("x"))
+    assert server.connections == 1
+    with pytest.raises(RuntimeError):
+        with pool.connection():
+            raise RuntimeError("not an SMTP reply")
+    with pool.connection() as conn:
+        conn.noop()
+    assert server.connections == 2
+    pool.close()
@@ -0,0 +1,53 @@
+'''
+magic_methods.py: sorting and bulk construction of Person.
+
+    python -m pytest tests
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from oop_tutorial import magic_methods as mm
+
+
+def people(n, seed=0):
+    rng = random.Random(seed)
+    return [mm.Person(f"p{i}", rng.randrange(1, 20)) for i in range(n)]
+
+
+def pairs(ps):
+    return [(p.name, p.age) for p in ps]
+
+
+@pytest.mark.parametrize("n, buffer_size", [(10, 3), (10, 10), (10, 11), (5000, 37), (1, 1)])
+def test_external_sort_list_input_matches_sorted(n, buffer_size):
+    group = people(n)
+    assert pairs(mm.external_sort(group, buffer_size=buffer_size)) == pairs(sorted(group))
+
+
+def test_external_sort_merges_in_several_passes():
+    group = people(3000, seed=1)
+    got = mm.external_sort(iter(group), buffer_size=10, fan_in=3)
+    assert pairs(got) == pairs(sorted(group))
+
+
+def test_person_and_person_row_sort_together():
+    table = mm.PersonTable.from_people([mm.Person("a", 30), mm.Person("b", 20)])
+    mixed = [mm.Person("c", 25), table[0], mm.Person("d", 10), table[1]]
+    assert [p.name for p in sorted(mixed)] == ["d", "b", "c", "a"]
+    assert mm.Person("x", 1) < table[0] and not mm.Person("x", 99) <= table[0]
+
+
+@pytest.mark.parametrize("age, error", [(-1, ValueError), (70000, ValueError),
+                                        (30.5, TypeError), ("3", TypeError)])
+def test_person_table_rejects_ages_it_cannot_store(age, error):
+    table = mm.PersonTable()
+    with pytest.raises(error, match="0 to 65535"):
+        table.append("z", age)
+    assert len(table) == 0 and len(table._codes) == 0
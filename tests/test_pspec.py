@@ -0,0 +1,52 @@
+'''
+pspec.py: LinkedList node handles.
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from oop_tutorial import pspec
+
+
+def test_stale_handle_is_rejected():
+    ll = pspec.LinkedList([1, 2, 3])
+    n = ll.append_node(4)
+    ll.pop()
+    ll.append_node(5)
+    with pytest.raises(ValueError):
+        ll.remove_node(n)
+    with pytest.raises(ValueError):
+        ll.insert_after(n, 6)
+    assert list(ll) == [1, 2, 3, 5]
+
+
+def test_handles_survive_churn_and_splice():
+    ll = pspec.LinkedList()
+    other = pspec.LinkedList()
+    kept = [other.append_node(i) for i in range(5)]
+    ll.splice(other)
+    for i in range(100):
+        ll.append(i)
+        ll.pop()
+        ll.appendleft(i)
+        ll.popleft()
+    for n in kept[::2]:
+        ll.remove_node(n)
+    assert list(ll) == [1, 3]
+    assert [ll.pop(), ll.pop()] == [3, 1]
+
+
+def test_plain_queue_still_recycles_nodes():
+    ll = pspec.LinkedList(range(3))
+    ll.popleft()
+    assert ll._free_len == 1
+    ll.append(3)
+    assert ll._free_len == 0
+    assert list(ll) == [1, 2, 3]
@@ -0,0 +1,32 @@
+'''
+SOLID.py: ShapeCollection areas match each shape's own area().
+
+    python -m pytest tests
+'''
+
+import os
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from oop_tutorial import SOLID
+
+
+@pytest.mark.parametrize("shapes", [
+    [SOLID.Rectangle(2, 3), SOLID.Square(4)],
+    [SOLID.Rectangle(10**17 + 1, 1), SOLID.Square(2**27 + 1)],
+    [SOLID.Square(Decimal("0.1")), SOLID.Rectangle(Decimal("1.5"), 3)],
+    [SOLID.Rectangle(Fraction(1, 3), 3), SOLID.Square(Fraction(2, 7))],
+    [SOLID.Rectangle(1.5, 2.0), SOLID.Rectangle(2, 3), SOLID.Square(0.1), SOLID.Square(5)],
+])
+def test_areas_are_exact(shapes):
+    collection = SOLID.ShapeCollection(shapes)
+    expected = [s.area() for s in shapes]
+    assert collection.areas() == expected
+    assert list(map(type, collection.areas())) == list(map(type, expected))
+    assert collection.total_area() == sum(expected)
@@ -0,0 +1,63 @@
+'''
+SOLID.UserRepository group commit across threads and processes.
+
+    python -m pytest tests
+'''
+
+import multiprocessing as mp
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from oop_tutorial import SOLID
+
+
+def writer(path, worker, saves, threads):
+    sys.path.insert(0, ROOT)
+    from oop_tutorial import SOLID
+    repo = SOLID.UserRepository(path, group_commit=True, fsync=True)
+
+    def run(t):
+        for i in range(saves):
+            repo.save(SOLID.User(f"w{worker}-t{t}-{i}"))
+
+    pool = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    repo.close()
+
+
+def test_group_commit_across_processes(tmp_path):
+    path = str(tmp_path / "users.txt")
+    workers = [mp.Process(target=writer, args=(path, w, 50, 3)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    assert all(p.exitcode == 0 for p in workers)
+    expected = {f"w{w}-t{t}-{i}" for w in range(4) for t in range(3) for i in range(50)}
+    with open(path, "rb") as f:
+        lines = f.read().decode().splitlines()
+    assert len(lines) == len(expected) and set(lines) == expected
+    with SOLID.UserRepository(path) as repo:
+        assert all(repo.exists(name) for name in expected)
+    assert os.path.getsize(path + ".spool") == SOLID.UserRepository._SPOOL_HEADER
+
+
+def test_records_left_in_the_spool_are_committed_on_open(tmp_path):
+    path = str(tmp_path / "users.txt")
+    with SOLID.UserRepository(path, group_commit=True) as repo:
+        repo.save(SOLID.User("alice"))
+        # a writer that died after spooling, before anyone committed
+        repo._spool_records([b"bob\n", b"carol\n", b"torn"])
+    with SOLID.UserRepository(path, group_commit=True) as repo:
+        assert repo.get("bob").name == "bob" and repo.exists("carol")
+        assert not repo.exists("torn")
+        repo.save(SOLID.User("dave"))
+    with open(path, "rb") as f:
+        assert f.read() == b"alice\nbob\ncarol\ndave\n"